@@ -2,21 +2,20 @@ from runecaller.events.dispatch import dispatch, add_middleware
 from runecaller.events.subscribe import subscribe
 from runecaller.events.observe import log_event
 import asyncio
-from runecaller.events.dispatch import dispatch, add_middleware, register_listener
+from runecaller.events.dispatch import dispatch, add_middleware, register_listener, enable_persistence
 from runecaller.events.event import Event
 from runecaller.events.enhancements import (
     register_before_dispatch,
     register_after_dispatch,
     register_on_error,
     schedule_event,
-    requires_role,
-    init_persistence_db
+    requires_role
 )
 
 from bedrocked.reporting.reported import logger
 
-# Initialize persistent storage.
-init_persistence_db()
+# Initialize persistent storage and record every dispatched event.
+enable_persistence()
 
 # Example middleware that adds custom metadata.
 def add_custom_metadata(event):
@@ -1,5 +1,5 @@
 from runecaller.mods.extensions.framework import Extension
-from runecaller.events.dispatch import dispatch
+from runecaller.events.dispatch import dispatch, dispatch_fast
 from runecaller.hooks.hook_register import register_hook
 from runecaller.hooks.hook_executor import execute_hooks
 from runecaller.service_locator import ServiceLocator
@@ -48,8 +48,8 @@ class MyExtension(Extension):
     def on_activate_hook(self, *args, **kwargs):
         ext_name = kwargs.get("extension_name", "unknown")
         logger.debug(f"[{self.name}] on_activate_hook triggered for {ext_name}.")
-        # As part of the hook, dispatch another event.
-        dispatch("hook.triggered", {"message": f"Activation hook executed in {self.name}."})
+        # As part of the hook, dispatch another event; it only needs to reach local listeners.
+        dispatch_fast("hook.triggered", {"message": f"Activation hook executed in {self.name}."})
         return "hook_success"
 
 
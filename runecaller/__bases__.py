@@ -1,11 +1,8 @@
-from abc import ABC, abstractmethod
-
-
-class BaseHook(ABC):
+class BaseHook:
     """
-    Abstract base class for hooks.
+    Base class for hooks.
+    A plain class rather than an ABC, so isinstance() checks against it stay a plain MRO walk.
     """
-    @abstractmethod
     def execute(self, *args, **kwargs):
         """Implement hook logic here."""
-        pass
+        raise NotImplementedError
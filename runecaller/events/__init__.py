@@ -4,3 +4,20 @@ __version__ = "2.0.8"
 __author__ = "Patrick K. O'Brien"
 __maintainer__ = "Mike C. Fletcher"
 __license__ = "BSD"
+
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for event loops created from now on, if it is installed.
+
+    Call this before the first event loop is created (i.e. before the first
+    async dispatch). Returns False when uvloop is unavailable; on Windows
+    uvloop is not supported and asyncio keeps its default ProactorEventLoop.
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]  # optional extra
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
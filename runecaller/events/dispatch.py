@@ -1,13 +1,26 @@
 import asyncio
+import atexit
+import bisect
+import fnmatch
+import itertools
+import re
+import threading
 import time
-from typing import Any, Callable, Dict, List, Tuple, Union
-from runecaller.events.event import Event, current_event_context
-from runecaller.events.schema import EventSchema
+import weakref
+from collections import deque
+from functools import lru_cache, wraps
+from typing import Any, Callable, Coroutine, Deque, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, Union
+from runecaller.events.event import Event, current_event_context, dispatching
 from runecaller.events.enhancements import (
+    before_dispatch_hooks,
+    after_dispatch_hooks,
+    on_error_hooks,
     global_load_monitor,
     global_circuit_breaker,
     global_logging_config,
-    alert_event
+    alert_event,
+    init_persistence_db,
+    persist_event
 )
 
 from bedrocked.reporting.reported import logger
@@ -19,66 +32,518 @@ def add_middleware(fn: Callable[[Event], Event]):
     """Register a middleware function for events."""
     middleware.append(fn)
 
-# Listener registries remain the same as before (with advanced filtering already implemented)
-_listener_registry: Dict[str, List[Tuple[int, Callable[[Event], Any], Callable[[Event], bool]]]] = {}
-_wildcard_registry: List[Tuple[str, int, Callable[[Event], Any], Callable[[Event], bool]]] = []
+def _accept_all(event: Event) -> bool:
+    """Default listener predicate; accepts every event."""
+    return True
 
-def register_listener(event_pattern: str, listener: Callable[[Event], Any], priority: int = 10, predicate: Callable[[Event], bool] = lambda e: True):
+# Listener predicates are only truth-tested, so their results are not required to be bool.
+_Predicate = Callable[[Event], Any]
+# Registry entry: (priority, seq, listener, predicate, stateless, batchable).
+_Entry = Tuple[int, int, Callable[[Event], Any], _Predicate, bool, bool]
+
+class _WildcardTrie:
+    """
+    Prefix trie over dotted namespaces for '<namespace>.*' and '*' listener patterns.
+
+    Matching an event name walks one node per namespace segment, so lookup cost depends
+    on the depth of the name rather than on the number of wildcard subscriptions.
+    """
+    __slots__ = ('entries', 'children')
+
+    def __init__(self) -> None:
+        self.entries: List[_Entry] = []
+        self.children: Dict[str, '_WildcardTrie'] = {}
+
+    @staticmethod
+    def path(pattern: str) -> List[str]:
+        """Namespace segments of a wildcard pattern, e.g. 'app.user.*' -> ['app', 'user']."""
+        return pattern[:-1].split('.')[:-1]
+
+    def insert(self, pattern: str, entry: _Entry):
+        node = self
+        for segment in self.path(pattern):
+            node = node.children.setdefault(segment, _WildcardTrie())
+        node.entries.append(entry)
+
+    def remove(self, pattern: str, listener: Callable[[Event], Any]):
+        node = self
+        for segment in self.path(pattern):
+            child = node.children.get(segment)
+            if child is None:
+                return
+            node = child
+        node.entries = [entry for entry in node.entries if entry[2] != listener]
+
+    def match(self, event_name: str) -> List[_Entry]:
+        """Collect the entries of every wildcard pattern matching the event name."""
+        matched = list(self.entries)
+        node = self
+        for segment in event_name.split('.')[:-1]:
+            child = node.children.get(segment)
+            if child is None:
+                break
+            matched.extend(child.entries)
+            node = child
+        return matched
+
+# Wildcards that end on a namespace boundary ('*', 'app.*', 'app.user.*') are indexed in the trie.
+_TRIE_PATTERN = re.compile(r'^(?:[^*.]+\.)*\*$')
+
+# Listener registries; exact-name entries are kept ordered at insert time. The monotonic seq
+# breaks priority ties in registration order, so comparisons never reach the listener objects.
+_seq = itertools.count()
+_listener_registry: Dict[str, List[_Entry]] = {}
+_wildcard_trie = _WildcardTrie()
+# Other trailing-'*' wildcards (e.g. 'app*') with the prefix pre-sliced: (prefix, entry).
+_wildcard_prefixes: List[Tuple[str, _Entry]] = []
+# Wildcards elsewhere in the pattern (e.g. 'app.*.created'), matched with fnmatch: (pattern, entry).
+_wildcard_globs: List[Tuple[str, _Entry]] = []
+
+# Resolved listeners per event name, rebuilt only when the registries change:
+# event name -> (registry version, unconditional listeners or None, predicate filter,
+#                coroutine-function listeners, whether every listener is stateless,
+#                whether every listener accepts batched events, synchronous runner)
+_Filter = Callable[[Event], List[Callable[[Event], Any]]]
+_Runner = Callable[[Event], None]
+# Names with no listeners are not cached, and once LISTENER_CACHE_SIZE names are cached the
+# oldest entry is evicted, so event names that embed ids cannot grow the cache without bound.
+LISTENER_CACHE_SIZE = 4096
+_registry_version = 0
+_listener_cache: Dict[str, Tuple[int, Union[Tuple[Callable[[Event], Any], ...], None], _Filter, FrozenSet[Callable[[Event], Any]], bool, bool, _Runner]] = {}
+
+# Registrations (pattern, listener) that read current_event_context; the context variable
+# is only set during dispatch when one of these, or a before-dispatch hook, exists.
+_context_listeners: Dict[Tuple[str, Callable[[Event], Any]], int] = {}
+
+# Optional dispatch outputs; both stay off until explicitly configured.
+_HAS_PERSISTENCE = False
+_bus_forwarder: Optional[Callable[[List[Event]], None]] = None
+
+# Outbound bus events are coalesced and handed to the forwarder in batches of up to
+# BUS_BATCH_SIZE, at most BUS_FLUSH_INTERVAL seconds after the first one was queued.
+BUS_BATCH_SIZE = 256
+BUS_FLUSH_INTERVAL = 0.01
+_bus_outbox: Deque[Event] = deque()
+_bus_pending = threading.Event()
+_bus_full = threading.Event()
+_bus_flush_lock = threading.Lock()
+_bus_flusher_thread: Optional[threading.Thread] = None
+
+# Event loop used for coroutine listeners when async dispatch happens outside a running loop.
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_lock = threading.Lock()
+
+# Coroutine-listener batches from async dispatch still running; holding them here keeps the
+# tasks from being garbage-collected mid-flight. At most MAX_INFLIGHT_DISPATCHES batches run
+# at once per event loop, later ones wait their turn.
+MAX_INFLIGHT_DISPATCHES = 64
+_inflight_tasks: Set["asyncio.Task[Any]"] = set()
+_inflight_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+def _invalidate_listener_cache():
+    global _registry_version
+    _registry_version += 1
+
+def register_listener(event_pattern: str, listener: Callable[[Event], Any], priority: int = 10, predicate: _Predicate = _accept_all, wants_context: bool = False, stateless: bool = False, batchable: bool = False):
     """
     Subscribe a listener to an event pattern with an optional predicate filter.
+
+    ``'*'`` and ``'ns.*'`` match every event and every event below ``ns``; any other
+    ``'*'`` in a pattern (``'app*'``, ``'app.*.created'``) matches any run of characters,
+    dots included.
+    Listeners that read ``current_event_context`` must pass ``wants_context=True``.
+    Listeners that never keep a reference to the event after returning may pass
+    ``stateless=True``, which lets dispatch_fast() recycle Event objects.
+    Listeners that handle ``event.batch`` may pass ``batchable=True``; see batched_dispatch().
     """
+    if wants_context:
+        key = (event_pattern, listener)
+        _context_listeners[key] = _context_listeners.get(key, 0) + 1
+    entry = (priority, next(_seq), listener, predicate, stateless, batchable)
     if '*' in event_pattern:
-        _wildcard_registry.append((event_pattern, priority, listener, predicate))
+        if _TRIE_PATTERN.match(event_pattern):
+            _wildcard_trie.insert(event_pattern, entry)
+        elif event_pattern.endswith('*'):
+            _wildcard_prefixes.append((event_pattern[:-1], entry))
+        else:
+            _wildcard_globs.append((event_pattern, entry))
     else:
-        _listener_registry.setdefault(event_pattern, []).append((priority, listener, predicate))
-        _listener_registry[event_pattern].sort(key=lambda tup: tup[0])
+        bisect.insort(_listener_registry.setdefault(event_pattern, []), entry)
+    _invalidate_listener_cache()
 
 def unregister_listener(event_pattern: str, listener: Callable[[Event], Any]):
     """Unsubscribe a listener from an event."""
+    _context_listeners.pop((event_pattern, listener), None)
     if '*' in event_pattern:
-        global _wildcard_registry
-        _wildcard_registry = [
-            (pat, prio, l, pred) for pat, prio, l, pred in _wildcard_registry
-            if not (pat == event_pattern and l == listener)
+        global _wildcard_prefixes, _wildcard_globs
+        if _TRIE_PATTERN.match(event_pattern):
+            _wildcard_trie.remove(event_pattern, listener)
+        _wildcard_prefixes = [
+            entry for entry in _wildcard_prefixes
+            if not (entry[0] + '*' == event_pattern and entry[1][2] == listener)
+        ]
+        _wildcard_globs = [
+            entry for entry in _wildcard_globs
+            if not (entry[0] == event_pattern and entry[1][2] == listener)
         ]
     else:
         if event_pattern in _listener_registry:
             _listener_registry[event_pattern] = [
-                (prio, l, pred) for prio, l, pred in _listener_registry[event_pattern] if l != listener
+                entry for entry in _listener_registry[event_pattern] if entry[2] != listener
             ]
+    _invalidate_listener_cache()
+
+def _accept_unconditional(listeners: Tuple[Callable[[Event], Any], ...]) -> _Filter:
+    """Filter for a listener list without predicates; callers normally use the tuple directly."""
+    return lambda evt: list(listeners)
+
+def _compile_filter(resolved: List[Tuple[Callable[[Event], Any], _Predicate]]) -> _Filter:
+    """
+    Fuse the predicates of a resolved listener list into one generated function, so
+    filtering an event costs a single call frame rather than one per predicate.
+    Listeners registered without a predicate are appended unconditionally.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def _filter(evt):", "    out = []", "    append = out.append"]
+    for i, (listener, predicate) in enumerate(resolved):
+        namespace[f"_l{i}"] = listener
+        if predicate is _accept_all:
+            lines.append(f"    append(_l{i})")
+        else:
+            namespace[f"_p{i}"] = predicate
+            lines.append(f"    if _p{i}(evt): append(_l{i})")
+    lines.append("    return out")
+    exec(compile("\n".join(lines), "<runecaller listener filter>", "exec"), namespace)
+    return namespace["_filter"]
+
+def _compile_runner(listeners: Tuple[Callable[[Event], Any], ...]) -> _Runner:
+    """
+    Generate a straight-line equivalent of _dispatch_sync() for a fixed listener tuple:
+    each listener is called in order, failures are recorded and cancellation stops
+    propagation, without the generic loop.
+    """
+    namespace: Dict[str, Any] = {"_failed": _listener_failed, "_cancelled": _log_cancelled}
+    lines = ["def _run(ev):", "    if ev.cancelled:", "        return"]
+    for i, listener in enumerate(listeners):
+        namespace[f"_l{i}"] = listener
+        lines += [
+            "    try:",
+            f"        _l{i}(ev)",
+            "    except Exception as err:",
+            f"        _failed(_l{i}, ev, err)",
+            "    if ev.cancelled:",
+            "        return _cancelled(ev)",
+        ]
+    exec(compile("\n".join(lines), "<runecaller listener runner>", "exec"), namespace)
+    return namespace["_run"]
+
+def _filtered_runner(listener_filter: _Filter) -> _Runner:
+    """Runner for listener lists with predicates, which vary from event to event."""
+    return lambda ev: _dispatch_sync(listener_filter(ev), ev)
+
+# Generated code only pays off for names that are dispatched repeatedly: a name is served by
+# the generic loop and filter until it has been dispatched COMPILE_AFTER_HITS times.
+COMPILE_AFTER_HITS = 64
+
+def _run_nothing(ev: Event) -> None:
+    """Runner for names without listeners."""
+
+def _no_listeners(evt: Event) -> List[Callable[[Event], Any]]:
+    """Filter for names without listeners."""
+    return []
+
+def _compile_hot(event_name: str, version: int, unconditional: Optional[Tuple[Callable[[Event], Any], ...]],
+                 resolved: List[Tuple[Callable[[Event], Any], _Predicate]]) -> None:
+    """Swap generated code into a name's cache entry, unless the entry has been replaced since."""
+    cached = _listener_cache.get(event_name)
+    if cached is None or cached[0] != version:
+        return
+    if unconditional is not None:
+        listener_filter = cached[2]
+        runner = _compile_runner(unconditional)
+    else:
+        listener_filter = _compile_filter(resolved)
+        runner = _filtered_runner(listener_filter)
+    _listener_cache[event_name] = (version, unconditional, listener_filter, cached[3], cached[4], cached[5], runner)
+
+def _warm_runner(event_name: str, version: int, listeners: Tuple[Callable[[Event], Any], ...]) -> _Runner:
+    """Generic-loop runner that counts its calls and compiles the name once it is hot."""
+    hits = 0
+
+    def run(ev: Event) -> None:
+        nonlocal hits
+        hits += 1
+        if hits == COMPILE_AFTER_HITS:
+            _compile_hot(event_name, version, listeners, [])
+        _dispatch_sync(listeners, ev)
+    return run
+
+def _warm_filter(event_name: str, version: int,
+                 resolved: List[Tuple[Callable[[Event], Any], _Predicate]]) -> _Filter:
+    """Generic predicate filter that counts its calls and compiles the name once it is hot."""
+    hits = 0
+
+    def listener_filter(evt: Event) -> List[Callable[[Event], Any]]:
+        nonlocal hits
+        hits += 1
+        if hits == COMPILE_AFTER_HITS:
+            _compile_hot(event_name, version, None, resolved)
+        return [listener for listener, predicate in resolved if predicate(evt)]
+    return listener_filter
+
+def _resolve_listeners(event_name: str):
+    """
+    Merge the exact and wildcard entries matching an event name, ordered by (priority, seq),
+    and store the result in the listener cache (names without listeners are not stored).
+
+    The entry is stamped with the registry version read before the registries are walked,
+    so a registration racing with the walk leaves it stale rather than hiding the change.
+    """
+    version = _registry_version
+    entries = list(_listener_registry.get(event_name, ()))
+    entries.extend(_wildcard_trie.match(event_name))
+    for prefix, entry in _wildcard_prefixes:
+        if event_name.startswith(prefix):
+            entries.append(entry)
+    for pattern, entry in _wildcard_globs:
+        if fnmatch.fnmatchcase(event_name, pattern):
+            entries.append(entry)
+    if not entries:
+        return (version, (), _no_listeners, frozenset(), True, False, _run_nothing)
+    entries.sort()
+    resolved = [(entry[2], entry[3]) for entry in entries]
+    unconditional: Optional[Tuple[Callable[[Event], Any], ...]] = None
+    if all(predicate is _accept_all for _, predicate in resolved):
+        unconditional = tuple(listener for listener, _ in resolved)
+        listener_filter = _accept_unconditional(unconditional)
+        runner = _warm_runner(event_name, version, unconditional)
+    else:
+        listener_filter = _warm_filter(event_name, version, resolved)
+        runner = _filtered_runner(listener_filter)
+    coroutines = frozenset(listener for listener, _ in resolved if asyncio.iscoroutinefunction(listener))
+    poolable = all(entry[4] for entry in entries)
+    batchable = bool(entries) and all(entry[5] for entry in entries)
+    cached = (version, unconditional, listener_filter, coroutines, poolable, batchable, runner)
+    if len(_listener_cache) >= LISTENER_CACHE_SIZE:
+        try:
+            del _listener_cache[next(iter(_listener_cache))]
+        except (KeyError, RuntimeError, StopIteration):
+            # Another thread changed the cache meanwhile; it is back under the limit or close to it.
+            pass
+    _listener_cache[event_name] = cached
+    return cached
+
+def _cached_listeners(event_name: str):
+    """Return the listener cache entry for an event name, resolving it if stale."""
+    cached = _listener_cache.get(event_name)
+    if cached is None or cached[0] != _registry_version:
+        cached = _resolve_listeners(event_name)
+    return cached
 
-def get_listeners(event: Event) -> List[Callable[[Event], Any]]:
+def get_listeners(event: Event) -> Sequence[Callable[[Event], Any]]:
     """
     Retrieve all listeners for an event, including exact and wildcard matches,
     applying predicate filtering and sorting by priority.
+
+    The merged, priority-ordered listener list is cached per event name; when none of
+    the listeners carry a predicate the cached tuple is returned as-is, otherwise the
+    name's compiled predicate filter is applied.
+    """
+    _, unconditional, listener_filter, _, _, _, _ = _cached_listeners(event.name)
+    if unconditional is not None:
+        return unconditional
+    return listener_filter(event)
+
+def set_bus_forwarder(fn: Optional[Callable[[List[Event]], None]]):
     """
-    listeners: List[Tuple[int, Callable[[Event], Any]]] = []
-    for tup in _listener_registry.get(event.name, []):
-        priority, listener, predicate = tup
-        if predicate(event):
-            listeners.append((priority, listener))
-    for pattern, prio, listener, predicate in _wildcard_registry:
-        if pattern.endswith('*'):
-            prefix = pattern[:-1]
-            if event.name.startswith(prefix) and predicate(event):
-                listeners.append((prio, listener))
-    listeners.sort(key=lambda tup: tup[0])
-    return [listener for _, listener in listeners]
+    Set the callable that forwards batches of dispatched events to an external message bus.
+    Passing None disables forwarding. Events still queued are flushed to the previous forwarder.
+    """
+    global _bus_forwarder
+    flush_bus_outbox()
+    _bus_forwarder = fn
+
+def flush_bus_outbox() -> None:
+    """Hand every queued outbound event to the bus forwarder now."""
+    # The outbox is drained under the lock but forwarded after releasing it, so a forwarder
+    # may itself call flush_bus_outbox() or set_bus_forwarder().
+    with _bus_flush_lock:
+        forwarder = _bus_forwarder
+        queued: List[Event] = []
+        while _bus_outbox:
+            queued.append(_bus_outbox.popleft())
+    if forwarder is None:
+        return
+    for start in range(0, len(queued), BUS_BATCH_SIZE):
+        batch = queued[start:start + BUS_BATCH_SIZE]
+        try:
+            forwarder(batch)
+        except Exception as e:
+            logger.exception("Failed to forward {} event(s) to the message bus: {}", len(batch), e)
+
+def _bus_flusher():
+    while True:
+        # Sleep until something is queued, then give the batch a moment to fill.
+        _bus_pending.wait()
+        _bus_full.wait(BUS_FLUSH_INTERVAL)
+        _bus_pending.clear()
+        _bus_full.clear()
+        flush_bus_outbox()
+
+def _ensure_bus_flusher():
+    global _bus_flusher_thread
+    if _bus_flusher_thread is None:
+        with _bus_flush_lock:
+            if _bus_flusher_thread is None:
+                thread = threading.Thread(target=_bus_flusher, name="runecaller-bus-forwarder", daemon=True)
+                thread.start()
+                _bus_flusher_thread = thread
+                atexit.register(flush_bus_outbox)
 
 def forward_event_to_bus(event: Event):
     """
-    Stub for external message bus integration.
+    Queue an event for the configured external message bus; a no-op when none is set.
+    """
+    if _bus_forwarder is None:
+        return
+    _bus_outbox.append(event)
+    if _bus_flusher_thread is None:
+        _ensure_bus_flusher()
+    if not _bus_pending.is_set():
+        _bus_pending.set()
+    if len(_bus_outbox) >= BUS_BATCH_SIZE:
+        _bus_full.set()
+
+def enable_persistence(enabled: bool = True):
+    """
+    Turn persistence of dispatched events to the event history database on or off.
     """
-    logger.info(f"Forwarding event {event.name} to external message bus (Correlation ID: {event.metadata.get('correlation_id')})")
+    global _HAS_PERSISTENCE
+    if enabled:
+        init_persistence_db()
+    _HAS_PERSISTENCE = enabled
+
+def _event_schema():
+    """Import the Pydantic event schema on first validation rather than with this module."""
+    from runecaller.events.schema import EventSchema
+    return EventSchema
+
+@lru_cache(maxsize=1024)
+def _validate_shape(name: str, payload_keys: FrozenSet[Any], metadata_keys: FrozenSet[Any]):
+    """Run the schema once per (name, payload keys, metadata keys) shape; failures are not cached."""
+    _event_schema()(name=name, payload=dict.fromkeys(payload_keys), metadata=dict.fromkeys(metadata_keys))
 
 def validate_event(event: Event) -> Event:
     """
     Validate an event using a Pydantic schema.
+
+    The schema only constrains the name and the key types of the payload and metadata dicts,
+    so events repeating an already-validated shape skip the Pydantic model construction.
     """
-    validated = EventSchema(name=event.name, payload=event.payload, metadata=event.metadata)
+    name, payload, metadata = event.name, event.payload, event.metadata
+    if type(name) is str and type(payload) is dict and type(metadata) is dict:
+        _validate_shape(name, frozenset(payload), frozenset(metadata))
+    else:
+        _event_schema()(name=name, payload=payload, metadata=metadata)
     return event
 
-def dispatch(event: Union[Event, str], payload: Dict[str, Any] = None, mode: str = 'sync'):
+def _listener_failed(listener: Callable[[Event], Any], event: Event, error: Exception):
+    """Log, count and alert on a failed listener call."""
+    logger.exception("Error in listener {} for event {}: {}", listener, event.name, error)
+    global_circuit_breaker.record_failure(event.name)
+    alert_event(event.name, f"Listener failure: {error}")
+    if on_error_hooks:
+        _run_error_hooks(event, error)
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting it on a daemon thread on first use."""
+    global _worker_loop
+    if _worker_loop is None:
+        with _worker_loop_lock:
+            if _worker_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="runecaller-async-dispatch", daemon=True).start()
+                _worker_loop = loop
+    return _worker_loop
+
+def _log_cancelled(event: Event):
+    logger.debug("Event {} cancelled; stopping propagation.", event.name)
+
+def _dispatch_sync(listeners: Sequence[Callable[[Event], Any]], event_obj: Event):
+    """Call listeners in order until one cancels the event."""
+    # Cancellation is checked after each call; nothing else sets it between two listeners.
+    ev = event_obj
+    if ev.cancelled:
+        return
+    for listener in listeners:
+        try:
+            listener(ev)
+        except Exception as listener_err:
+            _listener_failed(listener, ev, listener_err)
+        if ev.cancelled:
+            _log_cancelled(ev)
+            break
+
+def dispatch_fast(name: str, payload: Optional[Dict[str, Any]] = None):
+    """
+    Dispatch an event straight to its listeners, synchronously.
+
+    Skips validation, load monitoring, the circuit breaker, middleware, lifecycle hooks,
+    persistence, bus forwarding and context propagation; listener failures are still
+    logged and recorded. When every listener for the name was registered with
+    ``stateless=True`` the Event object is recycled afterwards.
+    """
+    _, _, _, _, poolable, _, runner = _cached_listeners(name)
+    event_obj = Event.acquire(name, payload) if poolable else Event(name=name, payload=payload)
+    runner(event_obj)
+    if poolable:
+        event_obj.release()
+
+def _dispatch_async(listeners: Sequence[Callable[[Event], Any]], event_obj: Event):
+    """Run synchronous listeners inline and gather coroutine listeners into one task."""
+    try:
+        loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    coroutine_listeners = _cached_listeners(event_obj.name)[3]
+    coros = []
+    for listener in listeners:
+        if event_obj.cancelled:
+            logger.debug("Event {} cancelled; stopping propagation.", event_obj.name)
+            break
+        if listener in coroutine_listeners:
+            coros.append(async_listener_wrapper(listener, event_obj))
+            continue
+        try:
+            listener(event_obj)
+        except Exception as listener_err:
+            _listener_failed(listener, event_obj, listener_err)
+    if coros:
+        if loop is not None:
+            loop.create_task(_run_all(coros))
+        else:
+            asyncio.run_coroutine_threadsafe(_run_all(coros), _get_worker_loop())
+
+def _dispatch_deferred(listeners: Sequence[Callable[[Event], Any]], event_obj: Event):
+    """Record the event without running its listeners."""
+    logger.debug("Deferred dispatch for event {} with payload {}", event_obj.name, event_obj.payload)
+
+# Dispatch mode -> listener runner; dispatch() looks the mode up once per call.
+_MODE_DISPATCH: Dict[str, Callable[[Sequence[Callable[[Event], Any]], Event], None]] = {
+    'sync': _dispatch_sync,
+    'async': _dispatch_async,
+    'deferred': _dispatch_deferred,
+}
+
+def _run_error_hooks(event: Event, error: Exception):
+    """Fan an error out to the registered on-error hooks."""
+    try:
+        for hook in on_error_hooks:
+            hook(event, error)
+    except Exception as hook_err:
+        logger.exception("On-error hook failed for event {}: {}", event.name, hook_err)
+
+def dispatch(event: Union[Event, str], payload: Optional[Dict[str, Any]] = None, mode: str = 'sync'):
     """
     Dispatch an event with integrated advanced features:
       - Dynamic load adaptation
@@ -94,13 +559,13 @@ def dispatch(event: Union[Event, str], payload: Dict[str, Any] = None, mode: str
     try:
         event_obj = validate_event(event_obj)
     except Exception as e:
-        logger.exception(f"Event validation failed: {e}")
+        logger.exception("Event validation failed: {}", e)
         return
 
     # Step 2: Rate limiting (already handled by previous code) and now record the event for load monitoring.
     global_load_monitor.record_event()
     if global_load_monitor.is_high_load():
-        logger.warning(f"High load detected; forcing event {event_obj.name} into 'deferred' mode.")
+        logger.warning("High load detected; forcing event {} into 'deferred' mode.", event_obj.name)
         mode = 'deferred'
 
     # Step 3: Circuit Breaker Check
@@ -108,52 +573,126 @@ def dispatch(event: Union[Event, str], payload: Dict[str, Any] = None, mode: str
         alert_event(event_obj.name, "Circuit breaker tripped – event dispatch halted.")
         return
 
-    # Step 4: Set context propagation.
-    token = current_event_context.set(event_obj.metadata)
+    # Nothing but listeners to run: take the same path as dispatch_fast().
+    _before = before_dispatch_hooks
+    if (mode == 'sync' and not (middleware or _before or after_dispatch_hooks or _context_listeners
+                                or _HAS_PERSISTENCE or _bus_forwarder is not None)):
+        _cached_listeners(event_obj.name)[6](event_obj)
+        logger.info("Dispatched event {}.", event_obj.name)
+        return
+
+    # Step 4: Set context propagation, only if a hook or listener reads it.
+    if _before or _context_listeners:
+        with dispatching(event_obj):
+            _dispatch_with_hooks(event_obj, mode)
+    else:
+        _dispatch_with_hooks(event_obj, mode)
 
-    # Step 5: Apply middleware.
-    for fn in middleware:
-        event_obj = fn(event_obj)
+def _dispatch_with_hooks(event_obj: Event, mode: str):
+    """Steps 5 onwards of dispatch(): middleware, lifecycle hooks, outputs and listeners."""
+    # Step 5: Apply middleware and before-dispatch hooks (both lists are usually empty).
+    _mw = middleware
+    if _mw:
+        for fn in _mw:
+            event_obj = fn(event_obj)
+    _before = before_dispatch_hooks
+    if _before:
+        try:
+            for hook in _before:
+                hook(event_obj)
+        except Exception as hook_err:
+            logger.exception("Before-dispatch hook failed for event {}: {}", event_obj.name, hook_err)
+    _after = after_dispatch_hooks
+    _on_error = on_error_hooks
 
-    # Step 6: Persist event and forward externally.
-    # (Assumes persistence and forwarding are handled in separate modules; code omitted here for brevity.)
-    # persist_event(event_obj)  # If persistence is enabled
-    forward_event_to_bus(event_obj)
+    # Step 6: Persist event and forward externally, when configured.
+    if _HAS_PERSISTENCE:
+        persist_event(event_obj)
+    if _bus_forwarder is not None:
+        forward_event_to_bus(event_obj)
 
-    start_time = time.time()
+    # Timing is only needed by after-dispatch hooks.
+    start_time = time.perf_counter() if _after else 0.0
     listeners = get_listeners(event_obj)
 
     try:
-        if mode == 'sync':
-            for listener in listeners:
-                if event_obj.cancelled:
-                    logger.debug(f"Event {event_obj.name} cancelled; stopping propagation.")
-                    break
-                try:
-                    listener(event_obj)
-                except Exception as listener_err:
-                    logger.exception(f"Error in listener {listener} for event {event_obj.name}: {listener_err}")
-                    global_circuit_breaker.record_failure(event_obj.name)
-                    alert_event(event_obj.name, f"Listener failure: {listener_err}")
-        elif mode == 'async':
-            loop = asyncio.get_event_loop()
-            for listener in listeners:
-                if event_obj.cancelled:
-                    logger.debug(f"Event {event_obj.name} cancelled; stopping propagation.")
-                    break
-                loop.create_task(async_listener_wrapper(listener, event_obj))
-        elif mode == 'deferred':
-            logger.debug(f"Deferred dispatch for event {event_obj.name} with payload {event_obj.payload}")
-        else:
-            raise ValueError("Invalid dispatch mode. Choose 'sync', 'async', or 'deferred'.")
+        try:
+            run = _MODE_DISPATCH[mode]
+        except KeyError:
+            raise ValueError("Invalid dispatch mode. Choose 'sync', 'async', or 'deferred'.") from None
+        run(listeners, event_obj)
     except Exception as dispatch_error:
-        logger.exception(f"Dispatch error for event {event_obj.name}: {dispatch_error}")
+        logger.exception("Dispatch error for event {}: {}", event_obj.name, dispatch_error)
         global_circuit_breaker.record_failure(event_obj.name)
         alert_event(event_obj.name, f"Dispatch error: {dispatch_error}")
+        if _on_error:
+            _run_error_hooks(event_obj, dispatch_error)
     finally:
-        elapsed = time.time() - start_time
-        logger.info(f"Dispatched event {event_obj.name} in {elapsed:.4f} seconds.")
-        current_event_context.reset(token)
+        if _after:
+            elapsed = time.perf_counter() - start_time
+            try:
+                for after_hook in _after:
+                    after_hook(event_obj, elapsed)
+            except Exception as hook_err:
+                logger.exception("After-dispatch hook failed for event {}: {}", event_obj.name, hook_err)
+            logger.info("Dispatched event {} in {:.4f} seconds.", event_obj.name, elapsed)
+        else:
+            logger.info("Dispatched event {}.", event_obj.name)
+
+def batched_dispatch(window_ms: float = 1):
+    """
+    Decorate a dispatch function so that async dispatches of the same event name made
+    within ``window_ms`` of each other are coalesced into a single dispatch.
+
+    Coalescing only applies to names whose listeners were all registered with
+    ``batchable=True``; they receive one event carrying the last payload, with every
+    queued payload in ``event.batch``. Other names, other modes and calls made outside a
+    running event loop go straight through. Coalesced calls return a future resolved
+    once their batch has been dispatched.
+    """
+    def decorator(dispatch_fn: Callable[..., Any]) -> Callable[..., Any]:
+        pending: Dict[str, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+
+        def flush():
+            batches = list(pending.items())
+            pending.clear()
+            for name, queued in batches:
+                payloads = [payload for payload, _ in queued]
+                event_obj = Event(name=name, payload=payloads[-1])
+                event_obj.batch = payloads
+                try:
+                    dispatch_fn(event_obj, mode='async')
+                except Exception as batch_err:
+                    for _, future in queued:
+                        if not future.done():
+                            future.set_exception(batch_err)
+                    continue
+                for _, future in queued:
+                    if not future.done():
+                        future.set_result(None)
+
+        @wraps(dispatch_fn)
+        def wrapper(event: Union[Event, str], payload: Optional[Dict[str, Any]] = None, mode: str = 'sync'):
+            if mode != 'async' or not isinstance(event, str) or not _cached_listeners(event)[5]:
+                return dispatch_fn(event, payload, mode)
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return dispatch_fn(event, payload, mode)
+            if not pending:
+                if window_ms > 0:
+                    loop.call_later(window_ms / 1000, flush)
+                else:
+                    loop.call_soon(flush)
+            future = loop.create_future()
+            pending.setdefault(event, []).append((payload or {}, future))
+            return future
+
+        return wrapper
+    return decorator
+
+# dispatch() with same-name async dispatches coalesced within one millisecond.
+dispatch_batched = batched_dispatch()(dispatch)
 
 async def async_listener_wrapper(listener: Callable[[Event], Any], event: Event):
     try:
@@ -161,6 +700,20 @@ async def async_listener_wrapper(listener: Callable[[Event], Any], event: Event)
         if asyncio.iscoroutine(result):
             await result
     except Exception as e:
-        logger.exception(f"Error in async listener {listener} for event {event.name}: {e}")
+        logger.exception("Error in async listener {} for event {}: {}", listener, event.name, e)
         global_circuit_breaker.record_failure(event.name)
         alert_event(event.name, f"Async listener failure: {e}")
+        if on_error_hooks:
+            _run_error_hooks(event, e)
+
+async def _run_all(coros: List[Coroutine[Any, Any, Any]]):
+    task = asyncio.current_task()
+    if task is not None:
+        _inflight_tasks.add(task)
+        task.add_done_callback(_inflight_tasks.discard)
+    loop = asyncio.get_running_loop()
+    limit = _inflight_limits.get(loop)
+    if limit is None:
+        limit = _inflight_limits[loop] = asyncio.Semaphore(MAX_INFLIGHT_DISPATCHES)
+    async with limit:
+        await asyncio.gather(*coros, return_exceptions=True)
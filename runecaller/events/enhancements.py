@@ -13,7 +13,10 @@ event scheduling, security, load monitoring, circuit breaking, and logging.
     - register_after_dispatch: Registers a hook to be called after an event is dispatched.
     - register_on_error: Registers a hook to be called when an error occurs during event dispatch.
     - init_persistence_db: Initializes the persistence database for storing events.
-    - persist_event: Persists an event to the database.
+    - persist_event: Queues an event to be persisted to the database in batches.
+    - flush_persistence: Blocks until all queued events have been written.
+    - flush_persistence_async: Awaitable variant of flush_persistence.
+    - persistence_stats: Reports queued and dropped persistence events.
     - schedule_event: Schedules an event to be dispatched after a delay.
     - requires_role: Decorator to enforce role-based access control for event listeners.
     - event_stream: Yields events from the persistent storage in order.
@@ -27,18 +30,25 @@ event scheduling, security, load monitoring, circuit breaking, and logging.
 """
 
 import asyncio
+import atexit
 import logging
+import queue
+import threading
 import time
-import sqlite3
 import os
 import json
 from collections import deque
 from functools import wraps
-from typing import Callable, Any, List, Generator
+from typing import TYPE_CHECKING, Callable, Any, Dict, List, Generator, Optional, Tuple, Union
 import contextvars
 
 from bedrocked.reporting.reported import logger
 
+if TYPE_CHECKING:
+    import sqlite3
+
+    from runecaller.events.event import Event
+
 # -------------------------------
 # Lifecycle Hooks & Callbacks
 # -------------------------------
@@ -62,21 +72,34 @@ def register_on_error(fn: Callable[['Event', Exception], None]):
 # Rate Limiting & Throttling
 # -------------------------------
 class RateLimiter:
-    """Implements rate limiting for event handling."""
+    """
+    Implements rate limiting for event handling as a token bucket per key: up to max_calls
+    at once, refilled at max_calls per period.
+    """
     def __init__(self, max_calls: int, period: float):
         self.max_calls = max_calls
         self.period = period
-        self.calls = {}
+        self._rate_per_ns = max_calls / (period * 1_000_000_000)
+        # key -> [tokens, last refill in monotonic ns]; updated in place.
+        self._buckets: Dict[str, List] = {}
+        self._lock = threading.Lock()
 
     def allow(self, key: str) -> bool:
         """Checks if an event is allowed based on the rate limit."""
-        now = time.time()
-        timestamps = self.calls.get(key, [])
-        timestamps = [t for t in timestamps if now - t < self.period]
-        if len(timestamps) < self.max_calls:
-            timestamps.append(now)
-            self.calls[key] = timestamps
+        now = time.monotonic_ns()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            # Only bucket creation needs the lock; updates are single-item writes.
+            with self._lock:
+                bucket = self._buckets.setdefault(key, [float(self.max_calls), now])
+        tokens = bucket[0] + (now - bucket[1]) * self._rate_per_ns
+        if tokens > self.max_calls:
+            tokens = self.max_calls
+        bucket[1] = now
+        if tokens >= 1:
+            bucket[0] = tokens - 1
             return True
+        bucket[0] = tokens
         return False
 
 global_rate_limiter = RateLimiter(max_calls=5, period=1.0)
@@ -86,8 +109,18 @@ global_rate_limiter = RateLimiter(max_calls=5, period=1.0)
 # -------------------------------
 PERSISTENCE_DB = "event_history.db"
 
+# Persisted payloads and metadata are encoded with orjson when it is installed.
+try:
+    import orjson
+
+    def _encode(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    _encode = json.dumps
+
 def init_persistence_db():
     """Initializes the persistence database for storing events."""
+    import sqlite3
     if not os.path.exists(PERSISTENCE_DB):
         conn = sqlite3.connect(PERSISTENCE_DB)
         c = conn.cursor()
@@ -103,17 +136,118 @@ def init_persistence_db():
         conn.commit()
         conn.close()
 
+# Events are serialized on the dispatching thread and written by a background worker in
+# batches, one transaction per batch.
+PERSIST_BATCH_SIZE = 256
+PERSIST_HIGH_WATER = 10_000
+# Queue items are serialized rows (name, payload, metadata, timestamp) or flush markers.
+_PersistRow = Tuple[str, str, str, Optional[str]]
+_persist_queue: "queue.SimpleQueue[Union[_PersistRow, threading.Event]]" = queue.SimpleQueue()
+_persist_worker_thread: Optional[threading.Thread] = None
+_persist_worker_lock = threading.Lock()
+_persist_dropped = 0
+# Connection owned by the writer thread; opened on first write and kept for its lifetime.
+_persist_conn: Optional['sqlite3.Connection'] = None
+
+def _open_persist_connection() -> 'sqlite3.Connection':
+    """Opens the writer connection in WAL mode so readers never block batch writes."""
+    import sqlite3
+    conn = sqlite3.connect(PERSISTENCE_DB, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def _write_events(rows: List[_PersistRow]):
+    """Writes a batch of serialized events in a single transaction."""
+    global _persist_conn
+    try:
+        if _persist_conn is None:
+            _persist_conn = _open_persist_connection()
+        with _persist_conn:
+            _persist_conn.executemany("INSERT INTO events (name, payload, metadata, timestamp) VALUES (?, ?, ?, ?)", rows)
+    except Exception as e:
+        logger.exception("Failed to persist {} event(s): {}", len(rows), e)
+        # Reopen on the next batch in case the connection itself is broken.
+        if _persist_conn is not None:
+            try:
+                _persist_conn.close()
+            except Exception:
+                pass
+            _persist_conn = None
+
+def _persist_worker() -> None:
+    """Drains the persistence queue, writing up to PERSIST_BATCH_SIZE events at a time."""
+    while True:
+        item = _persist_queue.get()
+        rows: List[_PersistRow] = []
+        waiters: List[threading.Event] = []
+        while True:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                rows.append(item)
+                if len(rows) >= PERSIST_BATCH_SIZE:
+                    break
+            try:
+                item = _persist_queue.get_nowait()
+            except queue.Empty:
+                break
+        if rows:
+            _write_events(rows)
+        for waiter in waiters:
+            waiter.set()
+
+def _ensure_persist_worker():
+    global _persist_worker_thread
+    if _persist_worker_thread is None:
+        with _persist_worker_lock:
+            if _persist_worker_thread is None:
+                thread = threading.Thread(target=_persist_worker, name="runecaller-persistence", daemon=True)
+                thread.start()
+                _persist_worker_thread = thread
+
 def persist_event(event: 'Event'):
-    """Persists an event to the database."""
+    """Queues an event to be persisted to the database by the background writer."""
+    global _persist_dropped
     try:
-        conn = sqlite3.connect(PERSISTENCE_DB)
-        c = conn.cursor()
-        c.execute("INSERT INTO events (name, payload, metadata, timestamp) VALUES (?, ?, ?, ?)",
-                  (event.name, json.dumps(event.payload), json.dumps(event.metadata), event.metadata.get("timestamp")))
-        conn.commit()
-        conn.close()
+        row = (event.name, _encode(event.payload), _encode(event.metadata), event.timestamp_iso)
     except Exception as e:
-        logger.exception(f"Failed to persist event: {e}")
+        logger.exception("Failed to persist event: {}", e)
+        return
+    _ensure_persist_worker()
+    if _persist_queue.qsize() >= PERSIST_HIGH_WATER:
+        # Backpressure: drop the oldest queued event rather than grow without bound.
+        try:
+            oldest = _persist_queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            if isinstance(oldest, threading.Event):
+                _persist_queue.put_nowait(oldest)
+            else:
+                _persist_dropped += 1
+    _persist_queue.put_nowait(row)
+
+def flush_persistence(timeout: Optional[float] = None) -> bool:
+    """
+    Blocks until every event queued so far has been written.
+    Returns False if the timeout expired first.
+    """
+    if _persist_worker_thread is None:
+        return True
+    done = threading.Event()
+    _persist_queue.put_nowait(done)
+    return done.wait(timeout)
+
+async def flush_persistence_async(timeout: Optional[float] = None) -> bool:
+    """Awaitable variant of flush_persistence for use inside an event loop."""
+    return await asyncio.to_thread(flush_persistence, timeout)
+
+def persistence_stats() -> dict:
+    """Returns the number of events waiting to be written and the number dropped under backpressure."""
+    return {"queued": _persist_queue.qsize(), "dropped": _persist_dropped}
+
+atexit.register(flush_persistence, 5.0)
 
 # -------------------------------
 # Event Scheduling & Deferred Processing
@@ -135,7 +269,7 @@ def requires_role(required_role: str):
         def wrapper(event, *args, **kwargs):
             role = event.metadata.get("role")
             if role != required_role:
-                logger.warning(f"Access denied for event {event.name}: required role '{required_role}', found '{role}'")
+                logger.warning("Access denied for event {}: required role '{}', found '{}'", event.name, required_role, role)
                 return
             return fn(event, *args, **kwargs)
         return wrapper
@@ -148,6 +282,8 @@ def event_stream() -> Generator['Event', None, None]:
     """
     Yields events from the persistent storage in order.
     """
+    import sqlite3
+    flush_persistence()
     conn = sqlite3.connect(PERSISTENCE_DB)
     c = conn.cursor()
     for row in c.execute("SELECT name, payload, metadata, timestamp FROM events ORDER BY id ASC"):
@@ -214,12 +350,12 @@ class CircuitBreaker:
             self.failures[event_name] = (failure_count + 1, now)
         else:
             self.failures[event_name] = (1, now)
-        logger.debug(f"CircuitBreaker: Recorded failure for {event_name}: {self.failures[event_name]}")
+        logger.debug("CircuitBreaker: Recorded failure for {}: {}", event_name, self.failures[event_name])
 
     def reset(self, event_name: str):
         """Resets the failure count for an event."""
         if event_name in self.failures:
-            logger.debug(f"CircuitBreaker: Resetting failures for {event_name}")
+            logger.debug("CircuitBreaker: Resetting failures for {}", event_name)
             del self.failures[event_name]
 
 global_circuit_breaker = CircuitBreaker(failure_threshold=3, recovery_time=10)
@@ -246,4 +382,4 @@ def alert_event(event_name: str, message: str):
     """
     Logs a critical alert for an event.
     """
-    logger.critical(f"ALERT for event '{event_name}': {message}")
\ No newline at end of file
+    logger.critical("ALERT for event '{}': {}", event_name, message)
\ No newline at end of file
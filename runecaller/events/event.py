@@ -1,7 +1,10 @@
 import datetime
+import time
 import uuid
 from typing import Any, Dict, Optional, List
 import contextvars
+from collections import deque
+from contextlib import contextmanager
 from bedrocked.reporting.reported import logger
 
 
@@ -19,14 +22,14 @@ class EventMetadata:
         tags: Optional[List[str]] = None,
         group: Optional[str] = None,
         priority: int = 1,
-        timestamp: Optional[datetime] = None,
+        timestamp: Optional[datetime.datetime] = None,
         source: Optional[str] = None,
         initiator: Optional[str] = None,
         payload_schema: Optional[Dict] = None,
         execution_mode: str = "sync",  # Options: sync, async, deferred
         retry_policy: Optional[Dict] = None,
         persisted: bool = False,
-        expiration: Optional[datetime] = None,
+        expiration: Optional[datetime.datetime] = None,
         dependencies: Optional[List[str]] = None,
         allowed_handlers: Optional[List[str]] = None,
         confidentiality: str = "public",  # Options: public, private, classified
@@ -38,7 +41,7 @@ class EventMetadata:
         resource_usage: Optional[Dict] = None,
         error_count: int = 0,
         status: str = "pending",  # pending, processing, completed, failed
-        last_attempt: Optional[datetime] = None,
+        last_attempt: Optional[datetime.datetime] = None,
     ):
         self.event_name = event_name
         self.event_type = event_type
@@ -72,29 +75,70 @@ class EventMetadata:
 
 
 # Context variable for propagating event context.
-current_event_context = contextvars.ContextVar("current_event_context", default={})
+current_event_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar("current_event_context", default={})
 
 class Event:
     """
     Represents an event with a name, payload, metadata, and cancellation support.
     """
-    def __init__(self, name: str, payload: Dict[str, Any] = None, metadata: Dict[str, Any] = None, context: dict = None):
+    __slots__ = ('name', 'payload', 'metadata', 'context', 'parent', 'batch', 'cancelled', '__weakref__')
+
+    def __init__(self, name: str, payload: Optional[Dict[str, Any]] = None, metadata: Optional[Dict[str, Any]] = None, context: Optional[dict] = None):
         self.name = name
         self.payload = payload or {}
         self.metadata = metadata or {}
-        # Automatically set a timestamp.
-        self.metadata.setdefault("timestamp", datetime.datetime.now().isoformat())
+        # Automatically set a timestamp (epoch nanoseconds; see timestamp_iso for a formatted one).
+        self.metadata.setdefault("timestamp_ns", time.time_ns())
         # Ensure each event has a correlation id for tracing.
-        self.metadata.setdefault("correlation_id", str(uuid.uuid4()))
+        self.metadata.setdefault("correlation_id", uuid.uuid4().hex)
         self.metadata.setdefault("")
         # Unified context that can be passed along and updated.
         self.context = context or {}
         # Optionally, initialize context with metadata if needed.
-        self.context.setdefault("initial_timestamp", self.metadata["timestamp"])
+        self.context.setdefault("initial_timestamp", self.metadata["timestamp_ns"])
+
+        # Metadata of the event whose dispatch was in progress when this one was dispatched
+        # (only recorded while context propagation is active).
+        self.parent: Optional[Dict[str, Any]] = None
+
+        # Payloads of coalesced same-name dispatches, when delivered through batched_dispatch().
+        self.batch: Optional[List[Dict[str, Any]]] = None
 
         # Flag to allow listeners to cancel propagation.
         self.cancelled = False
 
+    @property
+    def timestamp_iso(self) -> Optional[str]:
+        """
+        The event's creation time as an ISO 8601 string, formatted on access.
+        A ``timestamp`` supplied in the metadata (e.g. by a replayed event) takes precedence.
+        """
+        timestamp = self.metadata.get("timestamp")
+        if timestamp is not None:
+            return timestamp
+        timestamp_ns = self.metadata.get("timestamp_ns")
+        if timestamp_ns is None:
+            return None
+        return datetime.datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+    @classmethod
+    def acquire(cls, name: str, payload: Optional[Dict[str, Any]] = None, metadata: Optional[Dict[str, Any]] = None, context: Optional[dict] = None) -> "Event":
+        """
+        Return a recycled Event from the pool, re-initialised in place, or a new one.
+        Pair with release() once nothing holds a reference to the event any more.
+        """
+        try:
+            event = _event_pool.pop()
+        except IndexError:
+            return cls(name, payload, metadata, context)
+        Event.__init__(event, name, payload, metadata, context)
+        return event
+
+    def release(self):
+        """Drop this event's references and return it to the pool for acquire()."""
+        self.payload = self.metadata = self.context = self.parent = self.batch = None
+        _event_pool.append(self)
+
     def cancel(self):
         """Cancel further propagation of this event."""
         self.cancelled = True
@@ -104,6 +148,29 @@ class Event:
                 f"metadata={self.metadata} context={self.context} cancelled={self.cancelled}>")
 
 
+# Released Event objects awaiting reuse by Event.acquire(); deque append/pop are atomic.
+_event_pool: deque = deque(maxlen=1024)
+
+
+@contextmanager
+def dispatching(event: Event):
+    """
+    Make an event's metadata the current event context for the duration of the block,
+    recording the enclosing event's metadata (if any) as ``event.parent``.
+    Nested blocks for the same event reuse the context instead of setting it again.
+    """
+    outer = current_event_context.get(None)
+    if outer is event.metadata:
+        yield event
+        return
+    event.parent = outer
+    token = current_event_context.set(event.metadata)
+    try:
+        yield event
+    finally:
+        current_event_context.reset(token)
+
+
 if __name__ == '__main__':
 # Example hook function
     def sample_hook(event):
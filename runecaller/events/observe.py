@@ -3,9 +3,9 @@ from bedrocked.reporting.reported import logger
 
 def log_event(event):
     """Observer that logs event details, including cancellation status."""
-    logger.info(f"Event observed: {event.name}, payload: {event.payload}, metadata: {event.metadata}, cancelled: {event.cancelled}")
+    logger.info("Event observed: {}, payload: {}, metadata: {}, cancelled: {}", event.name, event.payload, event.metadata, event.cancelled)
 
 def debug_event(event):
     """Detailed debug logging for events."""
-    logger.debug(f"Event debug: {event}")
+    logger.debug("Event debug: {!r}", event)
 
@@ -1,12 +1,10 @@
 """Refactored "safe reference" from dispatcher.py"""
-import weakref, traceback, sys
+import weakref, traceback
+from operator import attrgetter
+from types import MethodType
 
-if sys.hexversion >= 0x3000000:
-    im_func = '__func__'
-    im_self = '__self__'
-else:
-    im_func = 'im_func'
-    im_self = 'im_self'
+_get_self = attrgetter('__self__')
+_get_func = attrgetter('__func__')
 
 def safeRef(target, onDelete = None):
     """Return a *safe* weak reference to a callable target
@@ -19,20 +17,12 @@ def safeRef(target, onDelete = None):
         goes out of scope with the reference object, (either a
         weakref or a BoundMethodWeakref) as argument.
     """
-    if hasattr(target, im_self):
-        if getattr(target, im_self) is not None:
-            # Turn a bound method into a BoundMethodWeakref instance.
-            # Keep track of these instances for lookup by disconnect().
-            assert hasattr(target, im_func), """safeRef target %r has %s, but no %s, don't know how to create reference"""%( target,im_self,im_func)
-            reference = BoundMethodWeakref(
-                target=target,
-                onDelete=onDelete
-            )
-            return reference
-    if onDelete is not None:
-        return weakref.ref(target, onDelete)
-    else:
-        return weakref.ref( target )
+    if isinstance(target, MethodType):
+        # Turn a bound method into a BoundMethodWeakref instance.
+        # Keep track of these instances for lookup by disconnect().
+        return BoundMethodWeakref(target, onDelete)
+    # weakref.ref treats a None callback as no callback.
+    return weakref.ref(target, onDelete)
 
 class BoundMethodWeakref(object):
     """'Safe' and reusable weak references to instance methods
@@ -41,8 +31,9 @@ class BoundMethodWeakref(object):
     referencing a bound method without requiring that the
     method object itself (which is normally a transient
     object) is kept alive.  Instead, the BoundMethodWeakref
-    object keeps weak references to both the object and the
-    function which together define the instance method.
+    object wraps a single weakref.WeakMethod, which weakly
+    references both the object and the function which together
+    define the instance method.
 
     Attributes:
         key -- the identity key for the reference, calculated
@@ -54,8 +45,9 @@ class BoundMethodWeakref(object):
             target function is garbage collected (i.e. when
             this object becomes invalid).  These are specified
             as the onDelete parameters of safeRef calls.
-        weakSelf -- weak reference to the target object
-        weakFunc -- weak reference to the target function
+        weakMethod -- weakref.WeakMethod for the target method;
+            its callback fires once, when either the target object
+            or target function is garbage collected
 
     Class Attributes:
         _allInstances -- class attribute pointing to all live
@@ -79,6 +71,9 @@ class BoundMethodWeakref(object):
         deletionMethods attribute updated.  Otherwise the
         new instance is created and registered in the table
         of already-referenced methods.
+
+        The key and deletionMethods are set up here, once;
+        __init__ then only completes newly created instances.
         """
         key = cls.calculateKey(target)
         current =cls._allInstances.get(key)
@@ -87,16 +82,18 @@ class BoundMethodWeakref(object):
             return current
         else:
             base = super( BoundMethodWeakref, cls).__new__( cls )
+            base.key = key
+            base.deletionMethods = [onDelete]
+            base.weakMethod = None
             cls._allInstances[key] = base
-            base.__init__( target, onDelete, *arguments,**named)
             return base
     def __init__(self, target, onDelete=None):
         """Return a weak-reference-like instance for a bound method
 
         target -- the instance-method target for the weak
-            reference, must have <im_self> and <im_func> attributes
+            reference, must have __self__ and __func__ attributes
             and be reconstructable via:
-                target.<im_func>.__get__( target.<im_self> )
+                target.__func__.__get__( target.__self__ )
             which is true of built-in instance methods.
         onDelete -- optional callback which will be called
             when this weak reference ceases to be valid
@@ -104,17 +101,17 @@ class BoundMethodWeakref(object):
             collected).  Should take a single argument,
             which will be passed a pointer to this object.
         """
+        if self.weakMethod is not None:
+            # An existing reference returned by __new__, which already
+            # recorded onDelete; re-initialising would discard earlier ones.
+            return
         def remove(weak, self=self):
             """Set self.isDead to true when method or instance is destroyed"""
-            methods = self.deletionMethods[:]
-            del self.deletionMethods[:]
-            try:
-                del self.__class__._allInstances[ self.key ]
-            except KeyError:
-                pass
+            methods, self.deletionMethods = self.deletionMethods, []
+            self.__class__._allInstances.pop( self.key, None )
             for function in methods:
                 try:
-                    if hasattr(function, '__call__' ):
+                    if callable(function):
                         function( self )
                 except Exception as e:
                     try:
@@ -123,19 +120,16 @@ class BoundMethodWeakref(object):
                         print('''Exception during saferef %s cleanup function %s: %s'''%(
                             self, function, e
                         ))
-        self.deletionMethods = [onDelete]
-        self.key = self.calculateKey( target )
-        self.weakSelf = weakref.ref(getattr(target,im_self), remove)
-        self.weakFunc = weakref.ref(getattr(target,im_func), remove)
-        self.selfName = getattr(target,im_self).__class__.__name__
-        self.funcName = str(getattr(target,im_func).__name__)
+        self.weakMethod = weakref.WeakMethod(target, remove)
+        self.selfName = _get_self(target).__class__.__name__
+        self.funcName = str(_get_func(target).__name__)
     def calculateKey( cls, target ):
         """Calculate the reference key for this reference
 
         Currently this is a two-tuple of the id()'s of the
         target object and the target function respectively.
         """
-        return (id(getattr(target,im_self)),id(getattr(target,im_func)))
+        return (id(_get_self(target)),id(_get_func(target)))
     calculateKey = classmethod( calculateKey )
     def __str__(self):
         """Give a friendly representation of the object"""
@@ -165,9 +159,4 @@ class BoundMethodWeakref(object):
             You may call this method any number of times,
             as it does not invalidate the reference.
         """
-        target = self.weakSelf()
-        if target is not None:
-            function = self.weakFunc()
-            if function is not None:
-                return function.__get__(target)
-        return None
+        return self.weakMethod()
@@ -1,4 +1,7 @@
 import asyncio
+import contextvars
+import functools
+import inspect
 import time
 from bedrocked.reporting.reported import logger
 
@@ -7,15 +10,35 @@ from bedrocked.reporting.reported import logger
 _hook_middleware = []
 
 
+def _no_middleware(name: str, args, kwargs):
+    return args, kwargs
+
+
+def _compose_middleware(chain):
+    """Generate a single function that runs every middleware in the chain, in order."""
+    if not chain:
+        return _no_middleware
+    namespace = {f"_mw{i}": fn for i, fn in enumerate(chain)}
+    lines = ["def _apply(name, args, kwargs):"]
+    lines += [f"    args, kwargs = _mw{i}(name, args, kwargs)" for i in range(len(chain))]
+    lines.append("    return args, kwargs")
+    exec(compile("\n".join(lines), "<runecaller hook middleware>", "exec"), namespace)
+    return namespace["_apply"]
+
+
+# The middleware chain composed into one call; rebuilt whenever middleware is added.
+_composed_middleware = _no_middleware
+
+
 def add_hook_middleware(fn):
     """Register a middleware function for hooks."""
+    global _composed_middleware
     _hook_middleware.append(fn)
+    _composed_middleware = _compose_middleware(_hook_middleware)
 
 
 def apply_middleware(name: str, args, kwargs):
-    for mw in _hook_middleware:
-        args, kwargs = mw(name, args, kwargs)
-    return args, kwargs
+    return _composed_middleware(name, args, kwargs)
 
 
 def execute_hooks(name: str, *args, mode: str = 'sync', **kwargs):
@@ -35,36 +58,43 @@ def execute_hooks(name: str, *args, mode: str = 'sync', **kwargs):
     start_time = time.time()
 
     if mode == 'sync':
-        for priority, hook, enabled, deps in hooks:
+        for entry in hooks:
             try:
-                result = hook.execute(*args, **kwargs)
+                result = entry.call(*args, **kwargs)
                 results.append(result)
             except Exception as e:
-                logger.exception(f"Error executing hook {hook} for '{name}': {e}")
+                logger.exception("Error executing hook {} for '{}': {}", entry.hook, name, e)
     elif mode == 'async':
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         tasks = []
-        for priority, hook, enabled, deps in hooks:
-            tasks.append(loop.create_task(async_hook_wrapper(hook, *args, **kwargs)))
+        for entry in hooks:
+            tasks.append(loop.create_task(async_hook_wrapper(entry.call, *args, **kwargs)))
         results = tasks  # Caller can await them.
     elif mode == 'deferred':
-        logger.debug(f"Deferred execution for hook '{name}' with args {args} and kwargs {kwargs}")
+        logger.debug("Deferred execution for hook '{}' with args {} and kwargs {}", name, args, kwargs)
     else:
         raise ValueError("Invalid mode. Use 'sync', 'async', or 'deferred'.")
 
     elapsed = time.time() - start_time
-    logger.info(f"Executed hooks for '{name}' in {elapsed:.4f} seconds.")
+    logger.info("Executed hooks for '{}' in {:.4f} seconds.", name, elapsed)
     return results
 
 
-async def async_hook_wrapper(hook, *args, **kwargs):
+async def async_hook_wrapper(call, *args, **kwargs):
+    """Runs a hook's bound callable (HookEntry.call) from async dispatch."""
     try:
-        result = hook.execute(*args, **kwargs)
+        if inspect.iscoroutinefunction(call):
+            return await call(*args, **kwargs)
+        # Synchronous hooks run on the hook thread pool so they don't block the event loop,
+        # inside a copy of the caller's context so context variables stay visible.
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        result = await loop.run_in_executor(executor, functools.partial(context.run, call, *args, **kwargs))
         if asyncio.iscoroutine(result):
             return await result
         return result
     except Exception as e:
-        logger.exception(f"Error in async hook {hook}: {e}")
+        logger.exception("Error in async hook {}: {}", call, e)
 
 
 import concurrent.futures
@@ -76,4 +106,4 @@ def execute_hook_isolated(hook, *args, **kwargs):
 
 
 def audit_hook_execution(hook_name, inputs, outputs, exec_time):
-    logger.info(f"Hook {hook_name} executed in {exec_time:.4f}s; inputs: {inputs}, outputs: {outputs}")
+    logger.info("Hook {} executed in {:.4f}s; inputs: {}, outputs: {}", hook_name, exec_time, inputs, outputs)
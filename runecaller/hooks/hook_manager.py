@@ -1,6 +1,7 @@
 import asyncio
 import time
-from typing import Callable, Dict, Any, List, Optional
+from collections import deque
+from typing import Callable, Deque, Dict, Any, List, Optional
 
 from runecaller.__bases__ import BaseHook
 
@@ -20,6 +21,8 @@ class Hook(BaseHook):
         self.priority = priority
         self.name = name
         self.dependencies = dependencies or []
+        # Whether the callback is a coroutine function; fixed for the hook's lifetime.
+        self.is_async = asyncio.iscoroutinefunction(callback)
 
 class HookManager:
     """
@@ -27,11 +30,14 @@ class HookManager:
     monitoring and analytics, and a minimal internal event bus.
     """
 
+    # Number of execution times kept per hook point; older samples are discarded.
+    metrics_history: int = 10_000
+
     def __init__(self):
-        # Registry: hook point -> list of Hook objects.
+        # Registry: hook point -> list of Hook objects; lists are replaced, never mutated.
         self.hooks: Dict[str, List[Hook]] = {}
-        # Metrics for monitoring: hook point -> list of execution times.
-        self.metrics: Dict[str, List[float]] = {}
+        # Metrics for monitoring: hook point -> bounded ring of recent execution times.
+        self.metrics: Dict[str, Deque[float]] = {}
         # Minimal internal event subscriptions: event name -> async callback.
         self._event_subscriptions: Dict[str, Callable[[str, Dict[str, Any]], Any]] = {}
         # Initialize event subscriptions for already-registered hook points.
@@ -55,7 +61,7 @@ class HookManager:
             # Run the async trigger using asyncio.
             asyncio.run(self._event_subscriptions[hook_point](hook_point, context))
         else:
-            logger.warning(f"No event subscription found for hook point '{hook_point}'.")
+            logger.warning("No event subscription found for hook point '{}'.", hook_point)
 
     def load_hooks_from_config(self, config: dict):
         """
@@ -85,7 +91,7 @@ class HookManager:
                 enabled = hook_def.get("enabled", True)
                 dependencies = hook_def.get("dependencies", [])
                 if not enabled:
-                    logger.info(f"Skipping disabled hook '{class_name}' for '{hook_point}'.")
+                    logger.info("Skipping disabled hook '{}' for '{}'.", class_name, hook_point)
                     continue
                 try:
                     module = __import__(module_path, fromlist=[class_name])
@@ -99,9 +105,9 @@ class HookManager:
                         name=class_name,
                         dependencies=dependencies
                     )
-                    logger.info(f"Registered hook '{class_name}' under '{hook_point}' from config with priority {priority}.")
+                    logger.info("Registered hook '{}' under '{}' from config with priority {}.", class_name, hook_point, priority)
                 except Exception as e:
-                    logger.error(f"Error loading hook '{class_name}' from '{module_path}': {e}")
+                    logger.error("Error loading hook '{}' from '{}': {}", class_name, module_path, e)
 
     def register_hook(
         self,
@@ -114,15 +120,13 @@ class HookManager:
     ):
         """Dynamically registers a hook for a specific hook point."""
         hook = Hook(callback, condition, priority, name, dependencies)
-        if hook_point not in self.hooks:
-            self.hooks[hook_point] = []
-        self.hooks[hook_point].append(hook)
-        # Reorder hooks based on dependencies and priority.
-        self.hooks[hook_point] = self._resolve_order(self.hooks[hook_point])
+        # Reorder hooks based on dependencies and priority. The list is replaced rather than
+        # mutated, so a trigger already iterating the previous one is unaffected.
+        self.hooks[hook_point] = self._resolve_order([*self.hooks.get(hook_point, ()), hook])
         # Ensure the event subscription for this hook point exists.
         if hook_point not in self._event_subscriptions:
             self._event_subscriptions[hook_point] = self.trigger_hooks_async
-        logger.info(f"Registered hook '{name}' on '{hook_point}' with priority {priority}.")
+        logger.info("Registered hook '{}' on '{}' with priority {}.", name, hook_point, priority)
 
     def unregister_hook(self, hook_point: str, name: str):
         """Unregisters a hook by its name from a given hook point."""
@@ -130,7 +134,7 @@ class HookManager:
             before = len(self.hooks[hook_point])
             self.hooks[hook_point] = [hook for hook in self.hooks[hook_point] if hook.name != name]
             after = len(self.hooks[hook_point])
-            logger.info(f"Unregistered hook '{name}' from '{hook_point}'. Removed {before - after} hook(s).")
+            logger.info("Unregistered hook '{}' from '{}'. Removed {} hook(s).", name, hook_point, before - after)
 
     async def trigger_hooks_async(self, hook_point: str, context: Dict[str, Any] = {}) -> Dict[str, Any]:
         """
@@ -140,23 +144,23 @@ class HookManager:
         """
         hooks = self.hooks.get(hook_point, [])
         if not hooks:
-            logger.info("No hooks registered for '%s'", hook_point)
+            logger.info("No hooks registered for '{}'", hook_point)
             return context
 
         # Initialize metrics storage for this hook point.
         if hook_point not in self.metrics:
-            self.metrics[hook_point] = []
+            self.metrics[hook_point] = deque(maxlen=self.metrics_history)
 
         # Process each hook in order.
         for hook in hooks:
             if not hook.condition(context):
-                logger.info("Skipping hook '%s' on '%s'; condition not met.", hook.name, hook_point)
+                logger.info("Skipping hook '{}' on '{}'; condition not met.", hook.name, hook_point)
                 continue
 
             start_time = time.perf_counter()
             try:
                 # Check if the callback is asynchronous.
-                if asyncio.iscoroutinefunction(hook.callback):
+                if hook.is_async:
                     result = await hook.callback(context)
                 else:
                     result = hook.callback(context)
@@ -166,16 +170,16 @@ class HookManager:
 
                 exec_time = end_time - start_time
                 self.metrics[hook_point].append(exec_time)
-                logger.info("Executed hook '%s' on '%s' in %.4f seconds.", hook.name, hook_point, exec_time)
+                logger.info("Executed hook '{}' on '{}' in {:.4f} seconds.", hook.name, hook_point, exec_time)
 
                 # Chaining: if a hook returns an updated context, merge it.
                 if result is not None:
                     if isinstance(result, dict):
                         context.update(result)
                     else:
-                        logger.warning("Hook '%s' returned a non-dict value; skipping context merge.", hook.name)
+                        logger.warning("Hook '{}' returned a non-dict value; skipping context merge.", hook.name)
             except Exception as e:
-                logger.error("Error executing hook '%s' on '%s': %s", hook.name, hook_point, e)
+                logger.error("Error executing hook '{}' on '{}': {}", hook.name, hook_point, e)
         return context
 
     def trigger_hooks(self, hook_point: str, context: Dict[str, Any] = {}) -> Dict[str, Any]:
@@ -225,5 +229,5 @@ class HookManager:
         return ordered_hooks + unnamed_hooks
 
     def get_metrics(self, hook_point: str) -> List[float]:
-        """Returns the recorded execution times for hooks under a given hook point."""
-        return self.metrics.get(hook_point, [])
+        """Returns the recent execution times recorded for hooks under a given hook point."""
+        return list(self.metrics.get(hook_point, ()))
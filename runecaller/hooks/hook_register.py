@@ -1,8 +1,84 @@
+import bisect
+import heapq
+import threading
+from operator import attrgetter
+
 from bedrocked.reporting.reported import logger
 
 
-# A basic registry for hooks: {hook_name: [(priority, hook, enabled, dependencies), ...]}
+class HookEntry:
+    """
+    A registered hook. Unpacks like the (priority, hook, enabled, dependencies) tuples
+    it replaces; `enabled` can be toggled in place with set_hook_enabled(). `call` is
+    what both sync and async execution invoke: the hook's execute method when it has a
+    callable one, otherwise the hook itself, so plain functions need no BaseHook.
+    """
+    __slots__ = ("priority", "hook", "enabled", "dependencies", "call")
+
+    def __init__(self, priority: int, hook, enabled: bool, dependencies: list):
+        self.priority = priority
+        self.hook = hook
+        self.enabled = enabled
+        self.dependencies = dependencies
+        execute = getattr(hook, "execute", None)
+        self.call = execute if callable(execute) else hook
+
+    def __iter__(self):
+        return iter((self.priority, self.hook, self.enabled, self.dependencies))
+
+    def __repr__(self):
+        return f"<HookEntry {self.hook!r} priority={self.priority} enabled={self.enabled}>"
+
+
+# A basic registry for hooks: {hook_name: [HookEntry, ...]}
 _hook_registry = {}
+# Enabled hooks per name, in dependency order (priority breaks ties); rebuilt whenever the
+# name's entries change. Each value is an immutable tuple published by a single dict
+# assignment, so readers never lock; writers serialise on _registry_lock.
+_ordered_hooks = {}
+_registry_lock = threading.RLock()
+
+def _hook_label(hook) -> str:
+    """The name other hooks use to refer to `hook` in their dependencies."""
+    return getattr(hook, "name", None) or getattr(hook, "__name__", None) or type(hook).__name__
+
+def _order_hooks(name: str, entries: list) -> tuple:
+    """
+    Topologically sorts `entries` (already in priority order) so that each hook runs after
+    the hooks named in its dependencies, using Kahn's algorithm with priority as the
+    tie-breaker. Dependencies on hooks not registered under `name` are ignored; on a
+    cycle the hooks fall back to plain priority order.
+    """
+    if not any(entry.dependencies for entry in entries):
+        return tuple(entries)
+    positions = {}
+    for i, entry in enumerate(entries):
+        positions.setdefault(_hook_label(entry.hook), []).append(i)
+    dependents = [[] for _ in entries]
+    in_degree = [0] * len(entries)
+    for i, entry in enumerate(entries):
+        for dep in entry.dependencies:
+            for j in positions.get(dep, ()):
+                if j != i:
+                    dependents[j].append(i)
+                    in_degree[i] += 1
+    ready = [i for i, degree in enumerate(in_degree) if degree == 0]
+    heapq.heapify(ready)
+    ordered = []
+    while ready:
+        i = heapq.heappop(ready)
+        ordered.append(entries[i])
+        for j in dependents[i]:
+            in_degree[j] -= 1
+            if in_degree[j] == 0:
+                heapq.heappush(ready, j)
+    if len(ordered) != len(entries):
+        logger.warning("Cycle detected in dependencies of hooks for '{}'; falling back to priority ordering.", name)
+        return tuple(entries)
+    return tuple(ordered)
+
+def _refresh_enabled(name: str):
+    _ordered_hooks[name] = _order_hooks(name, [entry for entry in _hook_registry.get(name, ()) if entry.enabled])
 
 def register_hook(name: str, hook, priority: int = 10, enabled: bool = True, dependencies: list = None, tags: list = None):
     """
@@ -11,17 +87,32 @@ def register_hook(name: str, hook, priority: int = 10, enabled: bool = True, dep
     """
     dependencies = dependencies or []
     tags = tags or []
-    _hook_registry.setdefault(name, []).append((priority, hook, enabled, dependencies))
-    # Sort hooks by priority.
-    _hook_registry[name].sort(key=lambda tup: tup[0])
+    # Keep hooks sorted by priority; equal priorities stay in registration order.
+    with _registry_lock:
+        bisect.insort(_hook_registry.setdefault(name, []), HookEntry(priority, hook, enabled, dependencies), key=attrgetter("priority"))
+        _refresh_enabled(name)
 
 def unregister_hook(name: str, hook):
-    if name in _hook_registry:
-        logger.info(f"Hook found: {name}")
-        _hook_registry[name] = [entry for entry in _hook_registry[name] if entry[1] != hook]
-        logger.success(f"{name} was unregistered.")
-    else:
-        logger.error("Hook '{name}' was not found in the registry. Couldn't unregister the hook.")
+    with _registry_lock:
+        if name in _hook_registry:
+            logger.info("Hook found: {}", name)
+            _hook_registry[name] = [entry for entry in _hook_registry[name] if entry.hook != hook]
+            _refresh_enabled(name)
+            logger.success("{} was unregistered.", name)
+        else:
+            logger.error("Hook '{}' was not found in the registry. Couldn't unregister the hook.", name)
+
+def set_hook_enabled(name: str, hook, enabled: bool = True) -> bool:
+    """Enables or disables a registered hook in place. Returns False if it isn't registered."""
+    found = False
+    with _registry_lock:
+        for entry in _hook_registry.get(name, ()):
+            if entry.hook == hook:
+                entry.enabled = enabled
+                found = True
+        if found:
+            _refresh_enabled(name)
+    return found
 
 def get_registered_hooks(name: str):
-    return [entry for entry in _hook_registry.get(name, []) if entry[2]]  # Only enabled hooks
+    return _ordered_hooks.get(name, ())  # Only enabled hooks, dependencies first
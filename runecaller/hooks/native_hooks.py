@@ -6,7 +6,7 @@ from runecaller.__bases__ import BaseHook
 # Example default hook
 class DefaultPreHook(BaseHook):
     def execute(self, *args, **kwargs):
-        logger.debug("[DefaultPreHook] Pre-hook executed with:", args, kwargs)
+        logger.debug("[DefaultPreHook] Pre-hook executed with: args={} kwargs={}", args, kwargs)
         return args, kwargs
 
 
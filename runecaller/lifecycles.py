@@ -9,7 +9,7 @@ class LifecycleManager:
         Register a component that implements start() and shutdown() methods.
         """
         self.components.append(component)
-        logger.info(f"Registered component: {component.__class__.__name__}")
+        logger.info("Registered component: {}", component.__class__.__name__)
 
     def start(self):
         """
@@ -19,9 +19,9 @@ class LifecycleManager:
         for component in self.components:
             try:
                 component.start()
-                logger.success(f"Started: {component.__class__.__name__}")
+                logger.success("Started: {}", component.__class__.__name__)
             except Exception as e:
-                logger.exception(f"Failed to start {component.__class__.__name__}: {e}")
+                logger.exception("Failed to start {}: {}", component.__class__.__name__, e)
 
     def shutdown(self):
         """
@@ -31,9 +31,9 @@ class LifecycleManager:
         for component in self.components:
             try:
                 component.shutdown()
-                logger.success(f"Shutdown: {component.__class__.__name__}")
+                logger.success("Shutdown: {}", component.__class__.__name__)
             except Exception as e:
-                logger.exception(f"Failed to shutdown {component.__class__.__name__}: {e}")
+                logger.exception("Failed to shutdown {}: {}", component.__class__.__name__, e)
 
 
 if __name__ == '__main__':
@@ -13,5 +13,5 @@ def audit_event(extension_name: str, event_type: str, details: dict):
         'timestamp': timestamp,
         'details': details
     }
-    logger.info(f"Audit log: {log_entry}")
+    logger.info("Audit log: {}", log_entry)
     # Optionally, write this log entry to an external auditing system or file.
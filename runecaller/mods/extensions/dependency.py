@@ -1,4 +1,5 @@
-import networkx as nx
+from typing import Dict, List, Set, Tuple
+
 from bedrocked.reporting.reported import logger
 
 
@@ -9,24 +10,75 @@ class DependencyResolver:
     """
 
     def __init__(self):
-        # Directed graph: nodes are extensions; edges represent dependencies.
-        self.graph = nx.DiGraph()
+        # Directed graph: extension name -> names of the extensions it depends on.
+        self._adj: Dict[str, Tuple[str, ...]] = {}
+        # Extension name -> version.
+        self._versions: Dict[str, str] = {}
 
     def add_extension(self, extension):
         """
         Add an extension to the dependency graph.
         The extension must have attributes: name, version, and dependencies.
         """
-        self.graph.add_node(extension.name, version=extension.version)
-        for dep in extension.dependencies:
-            self.graph.add_edge(extension.name, dep)
+        self._versions[extension.name] = extension.version
+        self._adj[extension.name] = tuple(extension.dependencies)
+
+    def _cycles(self) -> List[List[str]]:
+        """
+        Return the strongly connected components that contain a cycle (more than one
+        member, or a self-dependency), using an iterative Tarjan's algorithm in O(V + E).
+        """
+        adj = self._adj
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        cycles: List[List[str]] = []
+        counter = 0
+
+        for root in adj:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(adj.get(root, ())))]
+            while work:
+                node, deps = work[-1]
+                for dep in deps:
+                    if dep not in index:
+                        index[dep] = lowlink[dep] = counter
+                        counter += 1
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(adj.get(dep, ()))))
+                        break
+                    if dep in on_stack:
+                        lowlink[node] = min(lowlink[node], index[dep])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in adj.get(node, ()):
+                            cycles.append(component[::-1])
+        return cycles
 
     def detect_conflicts(self):
         """
         Detect circular dependencies and return a list of issues found.
         """
         issues = []
-        cycles = list(nx.simple_cycles(self.graph))
+        cycles = self._cycles()
         if cycles:
             issues.append(f"Circular dependencies detected: {cycles}")
         # Additional version conflict checks can be added here.
@@ -34,6 +86,13 @@ class DependencyResolver:
 
     def get_dependency_graph(self):
         """
-        Return the internal dependency graph.
+        Return the dependency graph as a networkx DiGraph (networkx is only needed here).
         """
-        return self.graph
+        import networkx as nx
+        graph = nx.DiGraph()
+        for name, version in self._versions.items():
+            graph.add_node(name, version=version)
+        for name, deps in self._adj.items():
+            for dep in deps:
+                graph.add_edge(name, dep)
+        return graph
@@ -20,7 +20,7 @@ class Extension:
         Register the extension.
         This method can be overridden to perform setup tasks.
         """
-        logger.info(f"Registering extension {self.name} (v{self.version})")
+        logger.info("Registering extension {} (v{})", self.name, self.version)
         # Dependency injection stub: load required dependencies.
         self.inject_dependencies()
 
@@ -29,18 +29,18 @@ class Extension:
         Stub for dependency injection. Validate that dependencies are met.
         """
         if self.dependencies:
-            logger.info(f"Injecting dependencies for {self.name}: {self.dependencies}")
+            logger.info("Injecting dependencies for {}: {}", self.name, self.dependencies)
         # TODO: integrate with a dependency resolver.
 
     def activate(self):
         """Activate the extension."""
         self.active = True
-        logger.info(f"Activating extension {self.name}")
+        logger.info("Activating extension {}", self.name)
 
     def deactivate(self):
         """Deactivate the extension."""
         self.active = False
-        logger.info(f"Deactivating extension {self.name}")
+        logger.info("Deactivating extension {}", self.name)
 
     def execute(self, *args, **kwargs):
         """
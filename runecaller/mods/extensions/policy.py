@@ -23,6 +23,6 @@ class PolicyEngine:
         """
         for policy in self.policies:
             if not policy(extension):
-                logger.warning(f"Extension {extension.name} failed policy {policy.__name__}")
+                logger.warning("Extension {} failed policy {}", extension.name, policy.__name__)
                 return False
         return True
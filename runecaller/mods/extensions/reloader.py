@@ -1,16 +1,57 @@
-import importlib
+import os
+from typing import Dict, Optional
+
 from bedrocked.reporting.reported import logger
 
 
+# Module name -> source mtime at its last reload, used to skip reloads when nothing changed.
+_reload_mtimes: Dict[str, float] = {}
+
+
+def _latest_mtime(directory: str) -> float:
+    latest = 0.0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    latest = max(latest, _latest_mtime(entry.path))
+            elif entry.name.endswith(".py"):
+                latest = max(latest, entry.stat().st_mtime)
+    return latest
+
+
+def _module_mtime(module) -> Optional[float]:
+    """Latest source mtime of a module (every .py file beneath it, for packages), or None."""
+    try:
+        package_path = getattr(module, "__path__", None)
+        if package_path is not None:
+            return max((_latest_mtime(path) for path in package_path), default=None)
+        path = getattr(module, "__file__", None)
+        return os.path.getmtime(path) if path else None
+    except OSError:
+        return None
+
+
 def reload_extension(extension_module):
     """
     Dynamically reload an extension module.
     This allows updating the extension at runtime without restarting the application.
+    The reload is skipped if the module's source hasn't changed since it was last reloaded.
     """
+    import importlib
+
+    name = extension_module.__name__
+    mtime = _module_mtime(extension_module)
+    if mtime is not None and _reload_mtimes.get(name) == mtime:
+        logger.debug("Extension '{}' is unchanged since its last reload; skipping.", name)
+        return extension_module
+
     try:
         new_module = importlib.reload(extension_module)
-        logger.success(f"Extension '{extension_module.__name__}' reloaded successfully.")
+        if mtime is not None:
+            _reload_mtimes[name] = mtime
+        logger.success("Extension '{}' reloaded successfully.", extension_module.__name__)
         return new_module
     except Exception as e:
-        logger.exception(f"Failed to reload extension {extension_module.__name__}: {e}")
+        logger.exception("Failed to reload extension {}: {}", extension_module.__name__, e)
         return None
@@ -1,12 +1,14 @@
-import networkx as nx
-import matplotlib.pyplot as plt
 from bedrocked.reporting.reported import logger
 
 
 def visualize_dependency_graph(graph):
     """
     Visualize the dependency graph using matplotlib.
+    networkx and matplotlib are imported here so they are only loaded when a graph is drawn.
     """
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     pos = nx.spring_layout(graph)
     nx.draw(graph, pos, with_labels=True, node_color='lightblue',
             edge_color='gray', node_size=1500, font_size=10)
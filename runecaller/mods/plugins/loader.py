@@ -12,10 +12,10 @@ def discover_plugins(plugin_directory: str) -> List[str]:
     for file in os.listdir(plugin_directory):
         if file.endswith('.py') and file != '__init__.py':
             module_name = file[:-3]
-            logger.info(f"Discovered plugin: {module_name}")
+            logger.info("Discovered plugin: {}", module_name)
             plugins.append(module_name)
 
-    logger.debug(f"Discovered {len(plugins)} in total.")
+    logger.debug("Discovered {} in total.", len(plugins))
     return plugins
 
 def load_plugin(plugin_directory: str, plugin_name: str):
@@ -27,5 +27,5 @@ def load_plugin(plugin_directory: str, plugin_name: str):
         module = importlib.import_module(module_path)
         return module
     except ImportError as e:
-        logger.error(f"Error loading plugin {plugin_name}: {e}")
+        logger.error("Error loading plugin {}: {}", plugin_name, e)
         return None
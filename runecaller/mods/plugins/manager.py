@@ -25,21 +25,21 @@ def register_plugin(plugin_name: str, plugin_module: object):
     if hasattr(plugin_module, 'name') and hasattr(plugin_module, 'dependencies'):
         dependency_resolver.add_extension(plugin_module)
     audit_event(plugin_name, "register", {"status": "success"})
-    logger.success(f"Plugin {plugin_name} registered.")
+    logger.success("Plugin {} registered.", plugin_name)
 
 def enable_plugin(plugin_name: str):
     plugin = _loaded_plugins.get(plugin_name)
     if plugin and hasattr(plugin, 'activate'):
         plugin.activate()
         audit_event(plugin_name, "activate", {"status": "enabled"})
-        logger.success(f"Plugin {plugin_name} enabled.")
+        logger.success("Plugin {} enabled.", plugin_name)
 
 def disable_plugin(plugin_name: str):
     plugin = _loaded_plugins.get(plugin_name)
     if plugin and hasattr(plugin, 'deactivate'):
         plugin.deactivate()
         audit_event(plugin_name, "deactivate", {"status": "disabled"})
-        logger.success(f"Plugin {plugin_name} disabled.")
+        logger.success("Plugin {} disabled.", plugin_name)
 
 def get_plugin(plugin_name: str):
     return _loaded_plugins.get(plugin_name)
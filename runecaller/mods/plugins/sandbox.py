@@ -10,8 +10,8 @@ def run_in_sandbox(command: list):
     """
     try:
         result = subprocess.run(command, capture_output=True, text=True, check=True)
-        logger.info(f"Sandboxed command executed: {command}\nOutput: {result.stdout}")
+        logger.info("Sandboxed command executed: {}\nOutput: {}", command, result.stdout)
         return result.stdout
     except subprocess.CalledProcessError as e:
-        logger.error(f"Sandboxed command failed: {command}\nError: {e.stderr}")
+        logger.error("Sandboxed command failed: {}\nError: {}", command, e.stderr)
         return None
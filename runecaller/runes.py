@@ -9,14 +9,20 @@ from runecaller.events.dispatch import (
     unregister_listener,
     get_listeners,
     forward_event_to_bus,
+    set_bus_forwarder,
+    flush_bus_outbox,
+    enable_persistence,
     validate_event,
-    dispatch)
-from runecaller.events.event import Event, EventMetadata
+    dispatch,
+    dispatch_fast,
+    batched_dispatch,
+    dispatch_batched)
+from runecaller.events.event import Event, EventMetadata, current_event_context, dispatching
 from runecaller.events.observe import debug_event, log_event
 from runecaller.events.enhancements import *
 
 # Pull-in Hook-stuff
-from runecaller.hooks.hook_register import register_hook, get_registered_hooks, unregister_hook
+from runecaller.hooks.hook_register import register_hook, get_registered_hooks, unregister_hook, set_hook_enabled
 from runecaller.hooks.hook_manager import BaseHook, Hook, HookManager
 from runecaller.hooks.hook_executor import (
     add_hook_middleware,
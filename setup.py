@@ -0,0 +1,18 @@
+"""
+Optional ahead-of-time compilation of the event dispatch hot path.
+
+Builds are pure Python by default. Set ``RUNECALLER_COMPILE=1`` (with mypyc
+installed) to compile ``runecaller.events.dispatch`` into a native extension;
+the pure-Python module remains the fallback everywhere else.
+"""
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("RUNECALLER_COMPILE") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["runecaller/events/dispatch.py"])
+
+setup(ext_modules=ext_modules)
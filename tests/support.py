@@ -0,0 +1,9 @@
+"""Helpers shared by the test modules."""
+
+
+def labelled(label):
+    """Return a distinct callable, named ``label``, that accepts any arguments and returns ``label``."""
+    def call(*args, **kwargs):
+        return label
+    call.__name__ = label
+    return call
@@ -0,0 +1,65 @@
+import sys
+import unittest
+from types import SimpleNamespace
+
+from runecaller.mods.extensions.dependency import DependencyResolver
+
+
+def _resolver(graph):
+    resolver = DependencyResolver()
+    for name, dependencies in graph.items():
+        resolver.add_extension(SimpleNamespace(name=name, version="1.0", dependencies=dependencies))
+    return resolver
+
+
+def _cycle_sets(resolver):
+    return sorted(sorted(component) for component in resolver._cycles())
+
+
+class CycleDetectionTests(unittest.TestCase):
+    """DependencyResolver._cycles() and detect_conflicts()."""
+
+    def test_acyclic_graph_has_no_conflicts(self):
+        resolver = _resolver({"a": ["b", "c"], "b": ["c"], "c": [], "d": ["a"]})
+        self.assertEqual(resolver._cycles(), [])
+        self.assertEqual(resolver.detect_conflicts(), [])
+
+    def test_two_node_cycle(self):
+        resolver = _resolver({"a": ["b"], "b": ["a"]})
+        self.assertEqual(_cycle_sets(resolver), [["a", "b"]])
+        self.assertEqual(resolver.detect_conflicts(), ["Circular dependencies detected: [['a', 'b']]"])
+
+    def test_self_dependency_is_a_cycle(self):
+        resolver = _resolver({"a": ["a"], "b": ["a"]})
+        self.assertEqual(_cycle_sets(resolver), [["a"]])
+
+    def test_only_cyclic_components_are_reported(self):
+        resolver = _resolver({
+            "entry": ["x"],
+            "x": ["y"], "y": ["z"], "z": ["x", "leaf"],
+            "p": ["q"], "q": ["p"],
+            "leaf": [],
+        })
+        self.assertEqual(_cycle_sets(resolver), [["p", "q"], ["x", "y", "z"]])
+
+    def test_dependencies_on_unregistered_extensions_are_ignored(self):
+        resolver = _resolver({"a": ["missing"], "b": ["a", "also-missing"]})
+        self.assertEqual(resolver._cycles(), [])
+
+    def test_re_adding_an_extension_replaces_its_dependencies(self):
+        resolver = _resolver({"a": ["b"], "b": ["a"]})
+        resolver.add_extension(SimpleNamespace(name="b", version="2.0", dependencies=[]))
+        self.assertEqual(resolver._cycles(), [])
+
+    def test_long_chain_does_not_recurse(self):
+        length = sys.getrecursionlimit() * 2
+        graph = {f"n{i}": [f"n{i + 1}"] for i in range(length)}
+        graph[f"n{length}"] = ["n0"]
+        resolver = _resolver(graph)
+        cycles = resolver._cycles()
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(len(cycles[0]), length + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
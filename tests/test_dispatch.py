@@ -0,0 +1,448 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from runecaller.events import dispatch as dispatch_module
+from runecaller.events.dispatch import (
+    COMPILE_AFTER_HITS,
+    batched_dispatch,
+    dispatch,
+    dispatch_batched,
+    dispatch_fast,
+    flush_bus_outbox,
+    forward_event_to_bus,
+    get_listeners,
+    register_listener,
+    set_bus_forwarder,
+    unregister_listener,
+)
+from runecaller.events.enhancements import global_load_monitor
+from runecaller.events.event import Event, current_event_context, dispatching
+from tests.support import labelled
+
+
+class WildcardMatchingTests(unittest.TestCase):
+    """Exact and wildcard listener resolution in get_listeners()."""
+
+    def subscribe(self, pattern, listener, priority=10):
+        register_listener(pattern, listener, priority=priority)
+        self.addCleanup(unregister_listener, pattern, listener)
+
+    def test_star_matches_every_event(self):
+        catch_all = labelled("catch_all")
+        self.subscribe("*", catch_all)
+
+        for name in ("test", "test.dispatch", "test.dispatch.deep.name"):
+            self.assertIn(catch_all, get_listeners(Event(name)))
+
+    def test_namespace_wildcard_matches_children_only(self):
+        app_listener = labelled("app_listener")
+        self.subscribe("testapp.*", app_listener)
+
+        self.assertIn(app_listener, get_listeners(Event("testapp.x")))
+        self.assertIn(app_listener, get_listeners(Event("testapp.user.created")))
+        self.assertNotIn(app_listener, get_listeners(Event("testapp")))
+        self.assertNotIn(app_listener, get_listeners(Event("testapplication.x")))
+
+    def test_mid_pattern_wildcard_matches_with_fnmatch(self):
+        created = labelled("created")
+        self.subscribe("testglob.*.created", created)
+
+        self.assertIn(created, get_listeners(Event("testglob.user.created")))
+        self.assertIn(created, get_listeners(Event("testglob.user.profile.created")))
+        self.assertNotIn(created, get_listeners(Event("testglob.user.deleted")))
+
+        unregister_listener("testglob.*.created", created)
+        self.assertNotIn(created, get_listeners(Event("testglob.user.created")))
+
+    def test_mixed_exact_and_wildcard_keep_priority_order(self):
+        late_exact = labelled("late_exact")
+        early_wildcard = labelled("early_wildcard")
+        middle_exact = labelled("middle_exact")
+        middle_prefix = labelled("middle_prefix")
+        catch_all = labelled("catch_all")
+        self.subscribe("testorder.event", late_exact, priority=30)
+        self.subscribe("testorder.*", early_wildcard, priority=1)
+        self.subscribe("testorder.event", middle_exact, priority=20)
+        self.subscribe("testorder.ev*", middle_prefix, priority=20)
+        self.subscribe("*", catch_all, priority=25)
+
+        self.assertEqual(
+            list(get_listeners(Event("testorder.event"))),
+            [early_wildcard, middle_exact, middle_prefix, catch_all, late_exact],
+        )
+
+    def test_unregister_invalidates_cached_listeners(self):
+        exact = labelled("exact")
+        wildcard = labelled("wildcard")
+        register_listener("testcache.event", exact)
+        register_listener("testcache.*", wildcard)
+        self.assertEqual(list(get_listeners(Event("testcache.event"))), [exact, wildcard])
+
+        unregister_listener("testcache.*", wildcard)
+        self.assertEqual(list(get_listeners(Event("testcache.event"))), [exact])
+
+        unregister_listener("testcache.event", exact)
+        self.assertEqual(list(get_listeners(Event("testcache.event"))), [])
+
+
+class ListenerRunTests(unittest.TestCase):
+    """Listener order, cancellation and failures through dispatch_fast(), before and after compilation."""
+
+    def setUp(self):
+        self.calls = []
+
+    def subscribe(self, name, listener, **kwargs):
+        register_listener(name, listener, **kwargs)
+        self.addCleanup(unregister_listener, name, listener)
+
+    def recorder(self, label):
+        def listener(event):
+            self.calls.append(label)
+            if event.payload.get("fail") == label:
+                raise RuntimeError(label)
+            if event.payload.get("cancel") == label:
+                event.cancel()
+        listener.__name__ = label
+        return listener
+
+    def subscribe_chain(self, name, **kwargs):
+        for priority, label in enumerate(("first", "second", "third")):
+            self.subscribe(name, self.recorder(label), priority=priority, **kwargs)
+
+    def make_hot(self, name):
+        """Dispatch a name until its cache entry is compiled and return that entry."""
+        dispatch_fast(name, {})
+        warm = dispatch_module._listener_cache[name]
+        for _ in range(COMPILE_AFTER_HITS - 1):
+            dispatch_fast(name, {})
+        compiled = dispatch_module._listener_cache[name]
+        self.assertIsNot(compiled[6], warm[6])
+        self.calls.clear()
+        return warm, compiled
+
+    def assert_runs(self, name):
+        dispatch_fast(name, {})
+        self.assertEqual(self.calls, ["first", "second", "third"])
+        self.calls.clear()
+        dispatch_fast(name, {"cancel": "second"})
+        self.assertEqual(self.calls, ["first", "second"])
+        self.calls.clear()
+        dispatch_fast(name, {"fail": "first"})
+        self.assertEqual(self.calls, ["first", "second", "third"])
+        self.calls.clear()
+
+    def test_warm_runner(self):
+        self.subscribe_chain("testrun.warm")
+        self.assert_runs("testrun.warm")
+
+    def test_compiled_runner_keeps_order_cancellation_and_failures(self):
+        self.subscribe_chain("testrun.compiled")
+        self.make_hot("testrun.compiled")
+        self.assert_runs("testrun.compiled")
+
+    def test_compiled_filter_applies_predicates(self):
+        name = "testrun.filter"
+        skip = self.recorder("skipped")
+        self.subscribe_chain(name)
+        self.subscribe(name, skip, priority=1, predicate=lambda event: event.payload.get("with_skip"))
+        warm, compiled = self.make_hot(name)
+        self.assertIsNot(compiled[2], warm[2])
+
+        self.assert_runs(name)
+        dispatch_fast(name, {"with_skip": True})
+        self.assertEqual(self.calls, ["first", "second", "skipped", "third"])
+        self.assertIn(skip, get_listeners(Event(name, {"with_skip": True})))
+        self.assertNotIn(skip, get_listeners(Event(name, {})))
+
+    def test_registration_replaces_the_compiled_entry(self):
+        self.subscribe_chain("testrun.replace")
+        _, compiled = self.make_hot("testrun.replace")
+        self.subscribe("testrun.replace", self.recorder("fourth"), priority=9)
+        dispatch_fast("testrun.replace", {})
+        self.assertEqual(self.calls, ["first", "second", "third", "fourth"])
+        self.assertNotEqual(dispatch_module._listener_cache["testrun.replace"][0], compiled[0])
+
+    def test_names_without_listeners_are_not_cached(self):
+        dispatch_fast("testrun.nobody", {})
+        self.assertNotIn("testrun.nobody", dispatch_module._listener_cache)
+
+
+class EventPoolTests(unittest.TestCase):
+    """Event recycling by dispatch_fast() for names with only stateless listeners."""
+
+    def setUp(self):
+        self.seen = []
+
+    def listener(self, event):
+        self.seen.append((event, dict(event.payload)))
+
+    def test_stateless_listeners_reuse_the_event(self):
+        register_listener("testpool.stateless", self.listener, stateless=True)
+        self.addCleanup(unregister_listener, "testpool.stateless", self.listener)
+
+        dispatch_fast("testpool.stateless", {"n": 1})
+        first = self.seen[0][0]
+        self.assertIsNone(first.payload)
+        dispatch_fast("testpool.stateless", {"n": 2})
+
+        self.assertIs(self.seen[1][0], first)
+        self.assertEqual([payload for _, payload in self.seen], [{"n": 1}, {"n": 2}])
+
+    def test_other_listeners_get_a_fresh_event(self):
+        register_listener("testpool.stateful", self.listener)
+        self.addCleanup(unregister_listener, "testpool.stateful", self.listener)
+
+        dispatch_fast("testpool.stateful", {"n": 1})
+        dispatch_fast("testpool.stateful", {"n": 2})
+
+        self.assertIsNot(self.seen[0][0], self.seen[1][0])
+        self.assertEqual(self.seen[0][0].payload, {"n": 1})
+
+    def test_acquire_reinitialises_a_released_event(self):
+        event = Event.acquire("testpool.acquire", {"n": 1})
+        event.cancel()
+        event.release()
+        again = Event.acquire("testpool.again", {"n": 2})
+        self.assertIs(again, event)
+        self.assertEqual((again.name, again.payload, again.cancelled), ("testpool.again", {"n": 2}, False))
+
+
+class AsyncDispatchTests(unittest.TestCase):
+    """dispatch(mode='async'): sync listeners run inline, coroutine listeners are scheduled."""
+
+    def setUp(self):
+        max_events = global_load_monitor.max_events
+        global_load_monitor.max_events = 10 ** 9
+        self.addCleanup(setattr, global_load_monitor, "max_events", max_events)
+        self.calls = []
+
+    def subscribe(self, name, listener, **kwargs):
+        register_listener(name, listener, **kwargs)
+        self.addCleanup(unregister_listener, name, listener)
+
+    def test_coroutine_listeners_run_on_the_running_loop(self):
+        async def fire():
+            done = asyncio.Event()
+
+            async def later(event):
+                await asyncio.sleep(0)
+                self.calls.append("coroutine")
+                done.set()
+
+            self.subscribe("testasync.loop", later, priority=1)
+            self.subscribe("testasync.loop", lambda event: self.calls.append("sync"), priority=2)
+            dispatch("testasync.loop", mode="async")
+            self.assertEqual(self.calls, ["sync"])
+            await asyncio.wait_for(done.wait(), 5)
+
+        asyncio.run(fire())
+        self.assertEqual(self.calls, ["sync", "coroutine"])
+
+    def test_coroutine_listeners_run_on_the_worker_loop_outside_a_loop(self):
+        done = threading.Event()
+
+        async def later(event):
+            self.calls.append(threading.current_thread().name)
+            done.set()
+
+        self.subscribe("testasync.worker", later)
+        dispatch("testasync.worker", mode="async")
+        self.assertTrue(done.wait(5))
+        self.assertEqual(self.calls, ["runecaller-async-dispatch"])
+
+
+class ContextPropagationTests(unittest.TestCase):
+    """dispatch() sets current_event_context through dispatching() for context listeners."""
+
+    def setUp(self):
+        max_events = global_load_monitor.max_events
+        global_load_monitor.max_events = 10 ** 9
+        self.addCleanup(setattr, global_load_monitor, "max_events", max_events)
+
+    def test_listener_sees_event_context_and_parent(self):
+        seen = []
+
+        def inner(event):
+            seen.append(("inner", current_event_context.get(None) is event.metadata, event.parent))
+
+        def outer(event):
+            seen.append(("outer", current_event_context.get(None) is event.metadata, event.parent))
+            dispatch("testctx.inner")
+
+        register_listener("testctx.outer", outer, wants_context=True)
+        register_listener("testctx.inner", inner, wants_context=True)
+        self.addCleanup(unregister_listener, "testctx.outer", outer)
+        self.addCleanup(unregister_listener, "testctx.inner", inner)
+
+        outer_event = Event("testctx.outer")
+        dispatch(outer_event)
+
+        self.assertEqual(seen, [("outer", True, None), ("inner", True, outer_event.metadata)])
+        self.assertIsNone(current_event_context.get(None))
+
+    def test_dispatching_reuses_context_for_the_same_event(self):
+        event = Event("testctx.nested")
+        with dispatching(event):
+            with dispatching(event):
+                self.assertIs(current_event_context.get(None), event.metadata)
+            self.assertIs(current_event_context.get(None), event.metadata)
+        self.assertIsNone(event.parent)
+        self.assertIsNone(current_event_context.get(None))
+
+
+class BusForwardingTests(unittest.TestCase):
+    """Batching of outbound events by the bus forwarder thread."""
+
+    def setUp(self):
+        self.batches = []
+        self.received = threading.Event()
+        self.addCleanup(set_bus_forwarder, None)
+
+    def forwarder(self, batch):
+        self.batches.append([event.name for event in batch])
+        self.received.set()
+
+    def test_full_batch_is_flushed_before_the_interval(self):
+        with mock.patch.object(dispatch_module, "BUS_BATCH_SIZE", 3), \
+                mock.patch.object(dispatch_module, "BUS_FLUSH_INTERVAL", 30):
+            set_bus_forwarder(self.forwarder)
+            started = time.monotonic()
+            for i in range(3):
+                forward_event_to_bus(Event(f"testbus.size.{i}"))
+            self.assertTrue(self.received.wait(5))
+            self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(self.batches, [["testbus.size.0", "testbus.size.1", "testbus.size.2"]])
+
+    def test_partial_batch_is_flushed_after_the_interval(self):
+        with mock.patch.object(dispatch_module, "BUS_BATCH_SIZE", 100), \
+                mock.patch.object(dispatch_module, "BUS_FLUSH_INTERVAL", 0.05):
+            set_bus_forwarder(self.forwarder)
+            forward_event_to_bus(Event("testbus.interval.0"))
+            forward_event_to_bus(Event("testbus.interval.1"))
+            self.assertTrue(self.received.wait(5))
+        self.assertEqual(self.batches, [["testbus.interval.0", "testbus.interval.1"]])
+
+    def test_flush_splits_the_outbox_into_batches(self):
+        with mock.patch.object(dispatch_module, "BUS_BATCH_SIZE", 2), \
+                mock.patch.object(dispatch_module, "_bus_forwarder", self.forwarder):
+            dispatch_module._bus_outbox.extend(Event(f"testbus.split.{i}") for i in range(5))
+            flush_bus_outbox()
+        self.assertEqual(
+            self.batches,
+            [["testbus.split.0", "testbus.split.1"], ["testbus.split.2", "testbus.split.3"], ["testbus.split.4"]],
+        )
+
+    def test_forwarder_may_reconfigure_the_bus(self):
+        def reentrant(batch):
+            self.forwarder(batch)
+            flush_bus_outbox()
+            set_bus_forwarder(None)
+
+        with mock.patch.object(dispatch_module, "_bus_forwarder", reentrant):
+            dispatch_module._bus_outbox.append(Event("testbus.reentrant"))
+            worker = threading.Thread(target=flush_bus_outbox, daemon=True)
+            worker.start()
+            worker.join(5)
+            self.assertFalse(worker.is_alive(), "flush_bus_outbox deadlocked")
+        self.assertEqual(self.batches, [["testbus.reentrant"]])
+
+
+class BatchedDispatchTests(unittest.TestCase):
+    """Coalescing of same-name async dispatches by batched_dispatch()."""
+
+    def setUp(self):
+        max_events = global_load_monitor.max_events
+        global_load_monitor.max_events = 10 ** 9
+        self.addCleanup(setattr, global_load_monitor, "max_events", max_events)
+        self.dispatched = []
+
+    def subscribe(self, name, listener, **kwargs):
+        register_listener(name, listener, **kwargs)
+        self.addCleanup(unregister_listener, name, listener)
+
+    def record(self, event, payload=None, mode="sync"):
+        if isinstance(event, Event):
+            self.dispatched.append((event.name, event.payload, getattr(event, "batch", None), mode))
+        else:
+            self.dispatched.append((event, payload, None, mode))
+
+    def test_dispatches_within_the_window_are_coalesced_in_order(self):
+        self.subscribe("testbatch.tick", labelled("tick"), batchable=True)
+        fire = batched_dispatch(window_ms=5)(self.record)
+
+        async def burst():
+            futures = [fire("testbatch.tick", {"n": n}, mode="async") for n in range(3)]
+            self.assertEqual(self.dispatched, [])
+            return await asyncio.gather(*futures)
+
+        self.assertEqual(asyncio.run(burst()), [None, None, None])
+        payloads = [{"n": 0}, {"n": 1}, {"n": 2}]
+        self.assertEqual(self.dispatched, [("testbatch.tick", {"n": 2}, payloads, "async")])
+
+    def test_each_name_is_dispatched_as_its_own_batch(self):
+        self.subscribe("testbatch.a", labelled("a"), batchable=True)
+        self.subscribe("testbatch.b", labelled("b"), batchable=True)
+        fire = batched_dispatch(window_ms=5)(self.record)
+
+        async def burst():
+            await asyncio.gather(
+                fire("testbatch.a", {"n": 1}, mode="async"),
+                fire("testbatch.b", {"n": 2}, mode="async"),
+                fire("testbatch.a", {"n": 3}, mode="async"),
+            )
+
+        asyncio.run(burst())
+        self.assertEqual(self.dispatched, [
+            ("testbatch.a", {"n": 3}, [{"n": 1}, {"n": 3}], "async"),
+            ("testbatch.b", {"n": 2}, [{"n": 2}], "async"),
+        ])
+
+    def test_unbatchable_names_and_sync_mode_pass_straight_through(self):
+        self.subscribe("testbatch.mixed", labelled("batchable"), batchable=True)
+        self.subscribe("testbatch.mixed", labelled("plain"))
+        self.subscribe("testbatch.sync", labelled("sync"), batchable=True)
+        fire = batched_dispatch(window_ms=5)(self.record)
+
+        async def calls():
+            self.assertIsNone(fire("testbatch.mixed", {"n": 1}, mode="async"))
+            self.assertIsNone(fire("testbatch.sync", {"n": 2}))
+
+        asyncio.run(calls())
+        self.assertIsNone(fire("testbatch.mixed", {"n": 3}, mode="async"))
+        self.assertEqual(self.dispatched, [
+            ("testbatch.mixed", {"n": 1}, None, "async"),
+            ("testbatch.sync", {"n": 2}, None, "sync"),
+            ("testbatch.mixed", {"n": 3}, None, "async"),
+        ])
+
+    def test_dispatch_failure_is_set_on_every_future(self):
+        self.subscribe("testbatch.fail", labelled("fail"), batchable=True)
+        failure = RuntimeError("bus down")
+
+        def failing(event, payload=None, mode="sync"):
+            raise failure
+
+        fire = batched_dispatch(window_ms=0)(failing)
+
+        async def burst():
+            futures = [fire("testbatch.fail", {"n": n}, mode="async") for n in range(2)]
+            return await asyncio.gather(*futures, return_exceptions=True)
+
+        self.assertEqual(asyncio.run(burst()), [failure, failure])
+
+    def test_batchable_listener_receives_the_batch_through_dispatch(self):
+        seen = []
+        self.subscribe("testbatch.real", lambda event: seen.append(event.batch), batchable=True)
+
+        async def burst():
+            await asyncio.gather(*(dispatch_batched("testbatch.real", {"n": n}, mode="async") for n in range(3)))
+
+        asyncio.run(burst())
+        self.assertEqual(seen, [[{"n": 0}, {"n": 1}, {"n": 2}]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import textwrap
+import threading
+import unittest
+from unittest import mock
+
+from runecaller.events import enhancements
+from runecaller.events.enhancements import flush_persistence, init_persistence_db, persist_event, persistence_stats
+from runecaller.events.event import Event
+
+
+def _close_writer_connection():
+    flush_persistence(5)
+    if enhancements._persist_conn is not None:
+        enhancements._persist_conn.close()
+        enhancements._persist_conn = None
+
+
+class PersistenceWriterTests(unittest.TestCase):
+    """The background persistence writer and its queue."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = os.path.join(tmp.name, "events.db")
+        # The writer keeps its connection open; point it at this test's database.
+        _close_writer_connection()
+        patcher = mock.patch.object(enhancements, "PERSISTENCE_DB", self.db_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(_close_writer_connection)
+        init_persistence_db()
+
+    def stored_names(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return [name for (name,) in conn.execute("SELECT name FROM events ORDER BY id")]
+        finally:
+            conn.close()
+
+    def block_writer(self):
+        """Hold the writer inside its next batch write until the returned event is set."""
+        entered, release = threading.Event(), threading.Event()
+        write_events = enhancements._write_events
+
+        def blocked(rows):
+            entered.set()
+            release.wait(10)
+            write_events(rows)
+
+        patcher = mock.patch.object(enhancements, "_write_events", blocked)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(release.set)
+        return entered, release
+
+    def test_flush_writes_queued_events(self):
+        for i in range(3):
+            persist_event(Event(f"testpersist.{i}"))
+        self.assertTrue(flush_persistence(5))
+        self.assertEqual(self.stored_names(), ["testpersist.0", "testpersist.1", "testpersist.2"])
+
+    def test_writer_connection_is_reused_in_wal_mode(self):
+        with mock.patch.object(enhancements, "_open_persist_connection",
+                               wraps=enhancements._open_persist_connection) as opened:
+            persist_event(Event("testpersist.first"))
+            self.assertTrue(flush_persistence(5))
+            connection = enhancements._persist_conn
+            persist_event(Event("testpersist.second"))
+            self.assertTrue(flush_persistence(5))
+        self.assertEqual(opened.call_count, 1)
+        self.assertIs(enhancements._persist_conn, connection)
+        self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(self.stored_names(), ["testpersist.first", "testpersist.second"])
+
+    def test_flush_times_out_while_the_writer_is_busy(self):
+        entered, release = self.block_writer()
+        persist_event(Event("testpersist.blocked"))
+        self.assertTrue(entered.wait(5))
+        self.assertFalse(flush_persistence(0.05))
+        release.set()
+        self.assertTrue(flush_persistence(5))
+        self.assertEqual(self.stored_names(), ["testpersist.blocked"])
+
+    def test_oldest_event_is_dropped_at_the_high_water_mark(self):
+        entered, release = self.block_writer()
+        dropped = persistence_stats()["dropped"]
+        with mock.patch.object(enhancements, "PERSIST_HIGH_WATER", 2):
+            persist_event(Event("testpersist.in-flight"))
+            self.assertTrue(entered.wait(5))
+            for i in range(3):
+                persist_event(Event(f"testpersist.queued.{i}"))
+            self.assertEqual(persistence_stats()["dropped"], dropped + 1)
+        release.set()
+        self.assertTrue(flush_persistence(5))
+        self.assertEqual(
+            self.stored_names(),
+            ["testpersist.in-flight", "testpersist.queued.1", "testpersist.queued.2"],
+        )
+
+    def test_queued_events_are_drained_at_exit(self):
+        script = textwrap.dedent(f"""
+            from bedrocked.reporting.reported import logger
+            logger.remove()
+            from runecaller.events import enhancements
+            from runecaller.events.event import Event
+            enhancements.PERSISTENCE_DB = {self.db_path!r}
+            for i in range(50):
+                enhancements.persist_event(Event(f"testpersist.exit.{{i}}"))
+        """)
+        subprocess.run([sys.executable, "-c", script], check=True, env=os.environ.copy(),
+                       cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), timeout=60)
+        self.assertEqual(self.stored_names(), [f"testpersist.exit.{i}" for i in range(50)])
+
+
+if __name__ == "__main__":
+    unittest.main()
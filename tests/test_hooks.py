@@ -0,0 +1,156 @@
+import asyncio
+import contextvars
+import unittest
+
+from runecaller.hooks.hook_executor import execute_hooks
+from runecaller.hooks.hook_register import get_registered_hooks, register_hook, set_hook_enabled, unregister_hook
+from tests.support import labelled
+
+
+class PlainCallableHookTests(unittest.TestCase):
+    """Hooks registered as plain functions, without a BaseHook execute method."""
+
+    def setUp(self):
+        self.calls = []
+
+        def record(*args, **kwargs):
+            self.calls.append((args, kwargs))
+            return "done"
+
+        self.hook = record
+        register_hook("test.plain", record)
+        self.addCleanup(unregister_hook, "test.plain", record)
+
+    def test_sync_mode_calls_function(self):
+        results = execute_hooks("test.plain", 1, key="value")
+        self.assertEqual(results, ["done"])
+        self.assertEqual(self.calls, [((1,), {"key": "value"})])
+
+    def test_async_mode_calls_function(self):
+        async def fire():
+            tasks = execute_hooks("test.plain", 1, mode="async", key="value")
+            return await asyncio.gather(*tasks)
+
+        self.assertEqual(asyncio.run(fire()), ["done"])
+        self.assertEqual(self.calls, [((1,), {"key": "value"})])
+
+    def test_async_mode_awaits_coroutine_function(self):
+        async def record_async(value):
+            self.calls.append(value)
+            return value * 2
+
+        register_hook("test.plain.coroutine", record_async)
+        self.addCleanup(unregister_hook, "test.plain.coroutine", record_async)
+
+        async def fire():
+            return await asyncio.gather(*execute_hooks("test.plain.coroutine", 21, mode="async"))
+
+        self.assertEqual(asyncio.run(fire()), [42])
+        self.assertEqual(self.calls, [21])
+
+    def test_async_mode_keeps_context_for_sync_hooks(self):
+        request_id = contextvars.ContextVar("request_id")
+
+        def read_context():
+            return request_id.get(None)
+
+        register_hook("test.plain.context", read_context)
+        self.addCleanup(unregister_hook, "test.plain.context", read_context)
+
+        async def fire():
+            request_id.set("req-1")
+            return await asyncio.gather(*execute_hooks("test.plain.context", mode="async"))
+
+        self.assertEqual(asyncio.run(fire()), ["req-1"])
+
+    def test_async_mode_requires_a_running_loop(self):
+        with self.assertRaises(RuntimeError):
+            execute_hooks("test.plain", mode="async")
+
+
+class CallResolutionTests(unittest.TestCase):
+    """HookEntry.call prefers a callable execute method and otherwise calls the hook itself."""
+
+    def test_non_callable_execute_attribute_calls_hook(self):
+        class Flagged:
+            execute = False
+
+            def __call__(self, value):
+                return ("called", value)
+
+        hook = Flagged()
+        register_hook("test.flagged", hook)
+        self.addCleanup(unregister_hook, "test.flagged", hook)
+
+        self.assertEqual(execute_hooks("test.flagged", 1), [("called", 1)])
+
+        async def fire():
+            return await asyncio.gather(*execute_hooks("test.flagged", 2, mode="async"))
+
+        self.assertEqual(asyncio.run(fire()), [("called", 2)])
+
+    def test_execute_method_is_preferred(self):
+        class WithExecute:
+            def execute(self, value):
+                return ("executed", value)
+
+            def __call__(self, value):
+                return ("called", value)
+
+        hook = WithExecute()
+        register_hook("test.execute", hook)
+        self.addCleanup(unregister_hook, "test.execute", hook)
+
+        self.assertEqual(execute_hooks("test.execute", 1), [("executed", 1)])
+
+
+class DependencyOrderTests(unittest.TestCase):
+    """get_registered_hooks() returns hooks after the hooks they depend on."""
+
+    def register(self, name, hook, **kwargs):
+        register_hook(name, hook, **kwargs)
+        self.addCleanup(unregister_hook, name, hook)
+
+    def ordered_names(self, name):
+        return [entry.hook.__name__ for entry in get_registered_hooks(name)]
+
+    def test_without_dependencies_priority_order_is_kept(self):
+        for label, priority in (("c", 3), ("a", 1), ("b", 2)):
+            self.register("test.order.plain", labelled(label), priority=priority)
+        self.assertEqual(self.ordered_names("test.order.plain"), ["a", "b", "c"])
+
+    def test_dependencies_run_first_with_priority_tie_break(self):
+        self.register("test.order.deps", labelled("first"), priority=1, dependencies=["setup"])
+        self.register("test.order.deps", labelled("other"), priority=2)
+        self.register("test.order.deps", labelled("setup"), priority=5)
+        self.assertEqual(self.ordered_names("test.order.deps"), ["other", "setup", "first"])
+
+    def test_unknown_dependencies_are_ignored(self):
+        self.register("test.order.unknown", labelled("a"), priority=1, dependencies=["missing"])
+        self.register("test.order.unknown", labelled("b"), priority=2)
+        self.assertEqual(self.ordered_names("test.order.unknown"), ["a", "b"])
+
+    def test_disabled_dependency_does_not_block(self):
+        setup = labelled("setup")
+        self.register("test.order.disabled", labelled("first"), priority=1, dependencies=["setup"])
+        self.register("test.order.disabled", setup, priority=5)
+        self.assertTrue(set_hook_enabled("test.order.disabled", setup, False))
+        self.assertEqual(self.ordered_names("test.order.disabled"), ["first"])
+
+    def test_cycle_falls_back_to_priority_order(self):
+        self.register("test.order.cycle", labelled("a"), priority=1, dependencies=["b"])
+        self.register("test.order.cycle", labelled("b"), priority=2, dependencies=["a"])
+        self.register("test.order.cycle", labelled("c"), priority=0)
+        self.assertEqual(self.ordered_names("test.order.cycle"), ["c", "a", "b"])
+
+    def test_unregister_reorders(self):
+        setup = labelled("setup")
+        self.register("test.order.unregister", labelled("first"), priority=1, dependencies=["setup"])
+        register_hook("test.order.unregister", setup, priority=5)
+        self.assertEqual(self.ordered_names("test.order.unregister"), ["setup", "first"])
+        unregister_hook("test.order.unregister", setup)
+        self.assertEqual(self.ordered_names("test.order.unregister"), ["first"])
+
+
+if __name__ == "__main__":
+    unittest.main()
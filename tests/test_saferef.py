@@ -0,0 +1,40 @@
+import gc
+import unittest
+
+from runecaller.events.saferef import BoundMethodWeakref, safeRef
+
+
+class _Target:
+    def method(self):
+        return "called"
+
+
+class BoundMethodWeakrefTests(unittest.TestCase):
+    """Sharing and cleanup of BoundMethodWeakref instances."""
+
+    def test_live_references_to_the_same_method_are_shared(self):
+        target = _Target()
+        first = safeRef(target.method)
+        second = safeRef(target.method)
+        self.assertIs(first, second)
+        self.assertEqual(first()(), "called")
+
+    def test_dropped_reference_does_not_keep_its_callbacks(self):
+        target = _Target()
+        fired = []
+        stale = safeRef(target.method, lambda ref: fired.append("stale"))
+        key = stale.key
+        del stale
+        gc.collect()
+        self.assertNotIn(key, BoundMethodWeakref._allInstances)
+
+        live = safeRef(target.method, lambda ref: fired.append("live"))
+        del target
+        gc.collect()
+        self.assertEqual(fired, ["live"])
+        self.assertIsNone(live())
+        self.assertNotIn(key, BoundMethodWeakref._allInstances)
+
+
+if __name__ == "__main__":
+    unittest.main()